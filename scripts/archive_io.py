@@ -0,0 +1,254 @@
+"""
+archive_io.py — file access for the LiftTilYaDie tree, loose or packed
+
+The indexers read the archive through one of two backends with the same
+interface, both addressed by the file's normal path under ARCHIVE_ROOT:
+
+  LooseArchive : the checked-out public/LiftTilYaDie/ directory
+  PackArchive  : a single .pack file built by pack_archive.py, memory-mapped,
+                 members decompressed on demand
+
+Pack layout (all integers little-endian):
+
+    b"LTYDPAK1"                                  8-byte magic
+    member frames ...                            one compressed blob per file
+    index                                        zlib-compressed JSON
+    index_offset (u64) index_length (u64) magic  24-byte footer
+
+Each index entry records path, offset, length, size, codec, sha256 and
+mtime, so a reader can seek to one member without touching the others,
+decompress a member only as far as a byte range needs, and compare hashes
+without decompressing anything. Members are zstd frames when
+the zstandard package is installed, otherwise zlib; files that don't
+shrink (gif/jpg) are stored raw. The codec is recorded per member.
+"""
+
+import hashlib
+import json
+import mmap
+import struct
+import zlib
+from pathlib import Path
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# ---------------------------------------------------------------------------
+# Paths
+# ---------------------------------------------------------------------------
+
+REPO_ROOT    = Path(__file__).parent.parent
+ARCHIVE_ROOT = REPO_ROOT / "public" / "LiftTilYaDie"
+OUTPUT_DIR   = Path(__file__).parent / "output"
+DEFAULT_PACK = OUTPUT_DIR / "LiftTilYaDie.pack"
+
+# ---------------------------------------------------------------------------
+# Pack format
+# ---------------------------------------------------------------------------
+
+PACK_MAGIC = b"LTYDPAK1"
+FOOTER = struct.Struct("<QQ8s")
+PACK_VERSION = 1
+
+ZLIB_LEVEL = 9
+ZSTD_LEVEL = 19
+STREAM_CHUNK = 64 * 1024    # compressed bytes fed per step by read_range
+
+
+def default_codec() -> str:
+    return "zstd" if zstandard is not None else "zlib"
+
+
+def compress(data: bytes, codec: str) -> tuple[bytes, str]:
+    """Compress one member; fall back to 'raw' when it doesn't shrink."""
+    if codec == "zstd":
+        frame = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    else:
+        frame = zlib.compress(data, ZLIB_LEVEL)
+    if len(frame) >= len(data):
+        return data, "raw"
+    return frame, codec
+
+
+def decompress(frame: bytes, codec: str, size: int) -> bytes:
+    if codec == "raw":
+        return bytes(frame)
+    if codec == "zlib":
+        return zlib.decompress(frame)
+    if codec == "zstd":
+        return zstd_decompressor().decompress(frame, max_output_size=size)
+    raise ValueError(f"unknown codec {codec!r}")
+
+
+def decompress_prefix(chunks, codec: str, end: int) -> bytes:
+    """
+    The first end bytes of a compressed member given as successive chunks
+    of its frame; stops taking chunks once it has them.
+    """
+    if codec == "zlib":
+        d = zlib.decompressobj()
+    elif codec == "zstd":
+        d = zstd_decompressor().decompressobj()
+    else:
+        raise ValueError(f"unknown codec {codec!r}")
+    out = bytearray()
+    for chunk in chunks:
+        if len(out) >= end:
+            break
+        if codec == "zlib":
+            out += d.decompress(chunk, end - len(out))
+        else:
+            out += d.decompress(chunk)
+    return bytes(out[:end])
+
+
+def zstd_decompressor():
+    if zstandard is None:
+        raise RuntimeError("pack member is zstd-compressed but zstandard is not installed. "
+                           "Run: pip install zstandard")
+    return zstandard.ZstdDecompressor()
+
+
+def sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def read_pack_index(pack_path: Path) -> dict:
+    """Read just the central index of a pack (footer + index, no members)."""
+    with open(pack_path, "rb") as f:
+        if f.read(len(PACK_MAGIC)) != PACK_MAGIC:
+            raise ValueError(f"{pack_path} is not a LiftTilYaDie pack")
+        f.seek(-FOOTER.size, 2)
+        index_offset, index_length, magic = FOOTER.unpack(f.read(FOOTER.size))
+        if magic != PACK_MAGIC:
+            raise ValueError(f"{pack_path} has a truncated or corrupt footer")
+        f.seek(index_offset)
+        index = json.loads(zlib.decompress(f.read(index_length)))
+    if index.get("version") != PACK_VERSION:
+        raise ValueError(f"{pack_path}: unsupported pack version {index.get('version')}")
+    return index
+
+
+# ---------------------------------------------------------------------------
+# Backends
+# ---------------------------------------------------------------------------
+
+class LooseArchive:
+    """Files read straight from the directory tree."""
+
+    def __init__(self, root: Path = ARCHIVE_ROOT):
+        self.root = root
+
+    def __repr__(self):
+        return f"LooseArchive({self.root})"
+
+    def walk(self):
+        """Yield (path, rel_posix) for every file, sorted by path."""
+        for p in sorted(self.root.rglob("*")):
+            if p.is_file():
+                yield p, p.relative_to(self.root).as_posix()
+
+    def iterdir(self, directory: Path) -> list[Path]:
+        """Files directly inside directory, sorted."""
+        return [p for p in sorted(directory.iterdir()) if p.is_file()]
+
+    def size(self, path: Path) -> int:
+        return path.stat().st_size
+
+    def read_bytes(self, path: Path) -> bytes:
+        return path.read_bytes()
+
+    def read_range(self, path: Path, start: int, end: int) -> bytes:
+        """Bytes [start, end) of one file, without reading the rest."""
+        with open(path, "rb") as f:
+            f.seek(start)
+            return f.read(end - start)
+
+    def read_text(self, path: Path) -> str:
+        return self.read_bytes(path).decode("utf-8", errors="replace")
+
+    def sha256(self, path: Path) -> str:
+        return sha256_hex(self.read_bytes(path))
+
+    def close(self):
+        pass
+
+
+class PackArchive:
+    """Members of a .pack file, memory-mapped and decompressed on demand."""
+
+    def __init__(self, pack_path: Path = DEFAULT_PACK, root: Path = ARCHIVE_ROOT):
+        self.pack_path = pack_path
+        self.root = root
+        index = read_pack_index(pack_path)
+        self.members = {m["path"]: m for m in index["members"]}
+        self._file = open(pack_path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __repr__(self):
+        return f"PackArchive({self.pack_path}, {len(self.members)} members)"
+
+    def _member(self, path: Path) -> dict:
+        rel = path.relative_to(self.root).as_posix()
+        try:
+            return self.members[rel]
+        except KeyError:
+            raise FileNotFoundError(f"{rel} not in {self.pack_path.name}") from None
+
+    def walk(self):
+        for rel in sorted(self.members, key=Path):
+            yield self.root / rel, rel
+
+    def iterdir(self, directory: Path) -> list[Path]:
+        prefix = directory.relative_to(self.root).as_posix()
+        prefix = "" if prefix == "." else prefix + "/"
+        names = [
+            rel for rel in self.members
+            if rel.startswith(prefix) and "/" not in rel[len(prefix):]
+        ]
+        return sorted(self.root / rel for rel in names)
+
+    def size(self, path: Path) -> int:
+        return self._member(path)["size"]
+
+    def read_bytes(self, path: Path) -> bytes:
+        m = self._member(path)
+        frame = self._map[m["offset"]:m["offset"] + m["length"]]
+        return decompress(frame, m["codec"], m["size"])
+
+    def read_range(self, path: Path, start: int, end: int) -> bytes:
+        """
+        Bytes [start, end) of one member. Raw members are sliced in place;
+        compressed ones are decompressed from the front and only up to end.
+        """
+        m = self._member(path)
+        start, end = min(start, m["size"]), min(end, m["size"])
+        if end <= start:
+            return b""
+        if m["codec"] == "raw":
+            return self._map[m["offset"] + start:m["offset"] + end]
+        stop = m["offset"] + m["length"]
+        chunks = (
+            self._map[pos:min(pos + STREAM_CHUNK, stop)]
+            for pos in range(m["offset"], stop, STREAM_CHUNK)
+        )
+        return decompress_prefix(chunks, m["codec"], end)[start:]
+
+    def read_text(self, path: Path) -> str:
+        return self.read_bytes(path).decode("utf-8", errors="replace")
+
+    def sha256(self, path: Path) -> str:
+        return self._member(path)["sha256"]
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+
+def open_archive(pack_path: Path | None = None) -> LooseArchive | PackArchive:
+    """PackArchive when a pack is given, otherwise the loose tree."""
+    if pack_path is None:
+        return LooseArchive()
+    return PackArchive(pack_path)
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+build_payloads.py — compact per-meet JSON payloads for the frontend
+
+Converts every archived result page into a small JSON payload the frontend
+can render instead of shipping 30-120 KB of legacy <FONT>/<TD> markup:
+
+    {
+      "v": 2,
+      "meet": {file, name, date_start, date_end, location, source, year, units},
+      "scale": 1,                          # lift value = int / scale (kg)
+      "groups": [["M", "56"], ["F", "48"], ...],
+      "cols": ["group", "name", "team", "yob", "bwt", "place", "lifts"],
+      "rows": [[0, "Smith, John", "MWC", 1970, 55.8, 1,
+                [100, -105, 105, 125, 130, -135, 105, 130, 235]],
+               [0, "Doe, Jim", "", null, 55.2, null,
+                [null, null, null, null, null, null, 90, 110, 200]], ...]
+    }
+
+"lifts" is an integer array: sn1-3, cj1-3, best snatch, best C&J, total.
+Missed attempts are negative and null means no value; 0 is a real zero
+(e.g. a best snatch of 0 after three misses). "scale" is the
+smallest of 1/10/100 that keeps every lift on the page an integer. Rows
+come from extract_lifts.extract_rows(); meet metadata comes from
+results_index.json.
+
+Each payload is written under a content-hashed name with .gz (and .br
+when the brotli package is installed) precompressed siblings, and listed
+in manifest.json, so the files can be cached forever. Builds run in
+parallel worker processes and are incremental: a page whose source sha256,
+results_index metadata and builder version match the manifest is not
+rebuilt.
+
+Output: scripts/output/payloads/  (manifest.json + <slug>.<hash>.json[.gz|.br])
+
+Usage (from repo root):
+    python scripts/build_payloads.py
+    python scripts/build_payloads.py --pack          # read pages from LiftTilYaDie.pack
+    python scripts/build_payloads.py --force --workers 4
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from archive_io import ARCHIVE_ROOT, DEFAULT_PACK, open_archive  # noqa: E402
+from extract_lifts import REFERENCE_PAGE_RE, extract_rows  # noqa: E402
+from index_results import OUTPUT_DIR, REPO_ROOT, collect_files  # noqa: E402
+
+# ---------------------------------------------------------------------------
+# Paths
+# ---------------------------------------------------------------------------
+
+RESULTS_JSON = OUTPUT_DIR / "results_index.json"
+PAYLOAD_DIR = OUTPUT_DIR / "payloads"
+MANIFEST_PATH = PAYLOAD_DIR / "manifest.json"
+
+PAYLOAD_VERSION = 2
+HASH_CHARS = 12
+LIFT_COLUMNS = ("sn1", "sn2", "sn3", "cj1", "cj2", "cj3", "snatch", "cj", "total")
+SCALES = (1, 10, 100)
+# results_index fields copied into "meet"; a change to any of them rebuilds the payload
+META_FIELDS = ("meet_name", "date_start", "date_end", "location", "source")
+
+
+def builder_fingerprint() -> str:
+    """Changes when the payload layout or the row extraction changes."""
+    h = hashlib.sha256()
+    # extract_rows() also relies on index_results (dates, year_from_filename)
+    for name in ("build_payloads.py", "extract_lifts.py", "index_results.py"):
+        h.update((Path(__file__).parent / name).read_bytes())
+    return h.hexdigest()[:16]
+
+
+def meta_digest(meta: dict) -> str:
+    """Hash of the results_index fields a payload carries."""
+    fields = {k: meta.get(k, "") for k in META_FIELDS}
+    return hashlib.sha256(json.dumps(fields, sort_keys=True).encode()).hexdigest()[:16]
+
+
+# ---------------------------------------------------------------------------
+# Step 1 — Encode one page
+# ---------------------------------------------------------------------------
+
+def number(text: str) -> float | None:
+    return float(text) if text else None
+
+
+def page_scale(rows: list[dict]) -> int:
+    """Smallest scale that makes every lift value on the page an integer."""
+    values = [float(r[c]) for r in rows for c in LIFT_COLUMNS if r[c]]
+    for scale in SCALES:
+        if all(abs(v * scale - round(v * scale)) < 1e-6 for v in values):
+            return scale
+    return SCALES[-1]
+
+
+def encode_payload(rows: list[dict], meta: dict, rel_path: str) -> dict:
+    scale = page_scale(rows)
+    groups: dict[tuple[str, str], int] = {}
+    encoded = []
+    for r in rows:
+        group = groups.setdefault((r["sex"], r["weight_class"]), len(groups))
+        lifts = [round(float(r[c]) * scale) if r[c] else None for c in LIFT_COLUMNS]
+        encoded.append([
+            group,
+            r["name"],
+            r["team"],
+            int(r["yob"]) if r["yob"] else None,
+            number(r["bwt"]),
+            int(r["place"]) if r["place"] else None,
+            lifts,
+        ])
+    return {
+        "v": PAYLOAD_VERSION,
+        "meet": {
+            "file": rel_path,
+            "name": meta.get("meet_name", ""),
+            "date_start": meta.get("date_start", ""),
+            "date_end": meta.get("date_end", ""),
+            "location": meta.get("location", ""),
+            "source": meta.get("source", ""),
+            "year": int(rows[0]["meet_year"]) if rows and rows[0]["meet_year"] else None,
+            "units": rows[0]["units"] if rows else "",
+        },
+        "scale": scale,
+        "groups": [list(k) for k in groups],
+        "cols": ["group", "name", "team", "yob", "bwt", "place", "lifts"],
+        "rows": encoded,
+    }
+
+
+def build_one(job: tuple[str, str, str, bytes, dict]) -> dict:
+    """
+    Worker: extract, encode and compress one page.
+    job = (rel_path, file_path, filename, html bytes, results_index record)
+    """
+    rel_path, file_path, filename, data, meta = job
+    rows = extract_rows(data.decode("utf-8", errors="replace"), file_path, filename)
+    if not rows:
+        return {"rel_path": rel_path, "rows": 0}
+    body = json.dumps(encode_payload(rows, meta, rel_path),
+                      separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return {
+        "rel_path": rel_path,
+        "rows": len(rows),
+        "body": body,
+        "gzip": gzip.compress(body, 9, mtime=0),
+        "br": brotli.compress(body, quality=11) if brotli is not None else None,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Step 2 — Write payload files + manifest
+# ---------------------------------------------------------------------------
+
+def payload_slug(rel_path: str) -> str:
+    """'Results/96Marin.htm' -> 'results-96marin'"""
+    return Path(rel_path).with_suffix("").as_posix().lower().replace("/", "-")
+
+
+def write_payload(built: dict, source_sha256: str, source_bytes: int,
+                  meta_sha256: str, fingerprint: str) -> dict:
+    body = built["body"]
+    digest = hashlib.sha256(body).hexdigest()
+    name = f"{payload_slug(built['rel_path'])}.{digest[:HASH_CHARS]}.json"
+    (PAYLOAD_DIR / name).write_bytes(body)
+    (PAYLOAD_DIR / (name + ".gz")).write_bytes(built["gzip"])
+    entry = {
+        "file": name,
+        "sha256": digest,
+        "rows": built["rows"],
+        "bytes": len(body),
+        "gzip_bytes": len(built["gzip"]),
+        "source_sha256": source_sha256,
+        "source_bytes": source_bytes,
+        "meta_sha256": meta_sha256,
+        "builder": fingerprint,
+    }
+    if built["br"] is not None:
+        (PAYLOAD_DIR / (name + ".br")).write_bytes(built["br"])
+        entry["br_bytes"] = len(built["br"])
+    return entry
+
+
+def load_manifest() -> tuple[dict, dict]:
+    """(payloads, no_rows) of the last build."""
+    if not MANIFEST_PATH.exists():
+        return {}, {}
+    with open(MANIFEST_PATH, encoding="utf-8") as f:
+        manifest = json.load(f)
+    return manifest.get("payloads", {}), manifest.get("no_rows", {})
+
+
+def is_current(entry: dict | None, source_sha256: str, meta_sha256: str, fingerprint: str) -> bool:
+    if entry is None or entry["builder"] != fingerprint:
+        return False
+    if entry["source_sha256"] != source_sha256 or entry.get("meta_sha256") != meta_sha256:
+        return False
+    if "file" not in entry:
+        return True     # no_rows entry: nothing on disk to check
+    return (PAYLOAD_DIR / entry["file"]).exists() and ("br_bytes" in entry) == (brotli is not None)
+
+
+def remove_stale(payloads: dict[str, dict]) -> int:
+    """Delete payload files no longer listed in the manifest."""
+    keep = set()
+    for entry in payloads.values():
+        keep.update({entry["file"], entry["file"] + ".gz", entry["file"] + ".br"})
+    removed = 0
+    for p in PAYLOAD_DIR.glob("*.json*"):
+        if p.name != MANIFEST_PATH.name and p.name not in keep:
+            p.unlink()
+            removed += 1
+    return removed
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Build compact per-meet JSON payloads.")
+    parser.add_argument("--pack", type=Path, nargs="?", const=DEFAULT_PACK, metavar="PACK",
+                        help=f"read pages from a pack built by pack_archive.py (default {DEFAULT_PACK.name})")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--force", action="store_true", help="rebuild every payload")
+    args = parser.parse_args()
+
+    if not RESULTS_JSON.exists():
+        print(f"ERROR: {RESULTS_JSON} not found. Run: python scripts/index_results.py")
+        sys.exit(1)
+    with open(RESULTS_JSON, encoding="utf-8") as f:
+        meta_by_path = {r["file_path"]: r for r in json.load(f)}
+
+    archive = open_archive(args.pack)
+    fingerprint = builder_fingerprint()
+    previous, previous_empty = ({}, {}) if args.force else load_manifest()
+    if brotli is None:
+        print("NOTE: brotli not installed; writing .gz only. Run: pip install brotli")
+
+    print("Collecting result files...")
+    files = [
+        e for e in collect_files(archive)
+        if e["path"].suffix.lower() in (".htm", ".html")
+        and not REFERENCE_PAGE_RE.search(e["path"].name)
+    ]
+    print(f"  -> {len(files)} HTML result pages")
+
+    payloads: dict[str, dict] = {}
+    no_rows: dict[str, dict] = {}     # pages with no lift table, remembered so they aren't re-parsed
+    jobs, sources = [], {}
+    for e in files:
+        rel_path = e["path"].relative_to(ARCHIVE_ROOT).as_posix()
+        file_path = e["path"].relative_to(REPO_ROOT).as_posix()
+        meta = meta_by_path.get(file_path, {})
+        source_sha256, meta_sha256 = archive.sha256(e["path"]), meta_digest(meta)
+        if is_current(previous.get(rel_path), source_sha256, meta_sha256, fingerprint):
+            payloads[rel_path] = previous[rel_path]
+            continue
+        if is_current(previous_empty.get(rel_path), source_sha256, meta_sha256, fingerprint):
+            no_rows[rel_path] = previous_empty[rel_path]
+            continue
+        data = archive.read_bytes(e["path"])
+        sources[rel_path] = (source_sha256, len(data), meta_sha256)
+        jobs.append((rel_path, file_path, e["path"].name, data, meta))
+    archive.close()
+    print(f"  -> {len(payloads) + len(no_rows)} up to date, {len(jobs)} to build ({args.workers} workers)")
+
+    PAYLOAD_DIR.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    built_count = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for built in pool.map(build_one, jobs, chunksize=8):
+            source_sha256, source_bytes, meta_sha256 = sources[built["rel_path"]]
+            if not built["rows"]:
+                no_rows[built["rel_path"]] = {
+                    "source_sha256": source_sha256, "meta_sha256": meta_sha256, "builder": fingerprint,
+                }
+                continue
+            payloads[built["rel_path"]] = write_payload(
+                built, source_sha256, source_bytes, meta_sha256, fingerprint
+            )
+            built_count += 1
+    elapsed = time.perf_counter() - start
+
+    payloads = dict(sorted(payloads.items(), key=lambda kv: Path(kv[0])))
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+        json.dump({
+            "version": PAYLOAD_VERSION,
+            "builder": fingerprint,
+            "payloads": payloads,
+            "no_rows": dict(sorted(no_rows.items(), key=lambda kv: Path(kv[0]))),
+        }, f, indent=2)
+    removed = remove_stale(payloads)
+
+    source_total = sum(p["source_bytes"] for p in payloads.values())
+    json_total = sum(p["bytes"] for p in payloads.values())
+    gz_total = sum(p["gzip_bytes"] for p in payloads.values())
+    br_total = sum(p.get("br_bytes", 0) for p in payloads.values())
+
+    print()
+    print("=" * 50)
+    print("SUMMARY")
+    print(f"  Payloads            : {len(payloads)}")
+    print(f"  Built this run      : {built_count} in {elapsed:.1f} s")
+    print(f"  Pages without rows  : {len(no_rows)} (no payload)")
+    print(f"  Stale files removed : {removed}")
+    print(f"  Source HTML         : {source_total:,} bytes")
+    print(f"  JSON payloads       : {json_total:,} bytes ({json_total / max(source_total, 1):.0%})")
+    print(f"  gzip                : {gz_total:,} bytes ({gz_total / max(source_total, 1):.0%})")
+    if brotli is not None:
+        print(f"  brotli              : {br_total:,} bytes ({br_total / max(source_total, 1):.0%})")
+    print()
+    print(f"Output written to: {MANIFEST_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,589 @@
+#!/usr/bin/env python3
+"""
+compute_records.py — LiftTilYaDie Records Engine
+
+Computes the best snatch, clean & jerk and total for every
+(era, sex, weight class) from the lift rows written by extract_lifts.py,
+then checks the hand-maintained record pages against them:
+
+  - Results/AllTimeAMRecords.htm    (senior + junior records, by class)
+  - Results/SrNatsChampsByNumber.htm (senior national title counts)
+
+Bests are found with a vectorised group-by/argmax (numpy lexsort), so a
+full recompute over every archived lift takes well under a second.
+Rows whose class the era gives only to the other sex (a man at +75 Kg)
+are misread sessions; they are left out and listed in the SUMMARY.
+
+Outputs:
+  scripts/output/records.csv       (computed records)
+  scripts/output/records_diff.csv  (computed vs AllTimeAMRecords.htm)
+  scripts/output/champs_diff.csv   (computed vs SrNatsChampsByNumber.htm)
+
+Usage (from repo root):
+    python scripts/compute_records.py                  # full recompute
+    python scripts/compute_records.py --add FILE.htm   # fold one new meet
+                                                       # into records.csv
+"""
+
+import argparse
+import csv
+import html as htmllib
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    print("ERROR: numpy not installed. Run: pip install numpy")
+    sys.exit(1)
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from extract_lifts import (  # noqa: E402
+    LIFTS_CSV,
+    class_valid,
+    extract_file,
+    fmt,
+    load_lifts,
+    split_rows,
+    write_lifts,
+)
+from index_results import ARCHIVE_ROOT, OUTPUT_DIR, RESULTS_DIR  # noqa: E402
+
+# ---------------------------------------------------------------------------
+# Paths
+# ---------------------------------------------------------------------------
+
+RECORDS_CSV = OUTPUT_DIR / "records.csv"
+RECORDS_DIFF_CSV = OUTPUT_DIR / "records_diff.csv"
+CHAMPS_DIFF_CSV = OUTPUT_DIR / "champs_diff.csv"
+ALL_TIME_RECORDS_PAGE = RESULTS_DIR / "AllTimeAMRecords.htm"
+CHAMPS_BY_NUMBER_PAGE = RESULTS_DIR / "SrNatsChampsByNumber.htm"
+
+LIFTS = ("snatch", "cj", "total")
+
+RECORD_FIELDS = [
+    "era", "sex", "weight_class", "lift", "weight",
+    "name", "yob", "meet_year", "file_path",
+]
+
+# ---------------------------------------------------------------------------
+# Eras — each one is a distinct set of bodyweight classes / lifts
+# (first year, label), checked newest first
+# ---------------------------------------------------------------------------
+
+ERAS = [
+    (2019, "2019-"),          # IWF classes introduced Nov 2018
+    (1998, "1998-2018"),
+    (1993, "1993-1997"),
+    (1973, "1973-1992"),      # press dropped after 1972
+    (0, "pre-1973"),
+]
+
+JUNIOR_MAX_AGE = 20
+
+
+def era_for_year(year: int) -> str:
+    for start, label in ERAS:
+        if year >= start:
+            return label
+    return ""
+
+
+# ---------------------------------------------------------------------------
+# Step 1 — Columnar view of the lift rows
+# ---------------------------------------------------------------------------
+
+def to_float_array(values) -> "np.ndarray":
+    return np.array([float(v) if v else np.nan for v in values], dtype=np.float64)
+
+
+def build_columns(rows: list[dict]) -> dict[str, "np.ndarray"]:
+    """Turn lift row dicts into numpy columns (NaN for missing numbers)."""
+    cols = {
+        "file_path": np.array([r["file_path"] for r in rows], dtype=object),
+        "name": np.array([r["name"] for r in rows], dtype=object),
+        "sex": np.array([r["sex"] for r in rows], dtype=object),
+        "weight_class": np.array([r["weight_class"] for r in rows], dtype=object),
+        "meet_year": to_float_array(r["meet_year"] for r in rows),
+        "yob": to_float_array(r["yob"] for r in rows),
+        "bwt": to_float_array(r["bwt"] for r in rows),
+        "place": to_float_array(r["place"] for r in rows),
+    }
+    for lift in LIFTS:
+        cols[lift] = to_float_array(r[lift] for r in rows)
+
+    years = cols["meet_year"]
+    cols["era"] = np.array(
+        [era_for_year(int(y)) if y == y else "" for y in years], dtype=object
+    )
+    # '+75' on a man or '94' on a woman is a misread session, not a record
+    cols["class_valid"] = np.array(
+        [class_valid(r["meet_year"], r["sex"], r["weight_class"]) for r in rows], dtype=bool
+    )
+    return cols
+
+
+def rejected_rows(cols: dict[str, "np.ndarray"]) -> list[int]:
+    """Rows whose class the era's senior classes give only to the other sex."""
+    return np.flatnonzero(~cols["class_valid"]).tolist()
+
+
+# ---------------------------------------------------------------------------
+# Step 2 — Vectorised group-by / argmax
+# ---------------------------------------------------------------------------
+
+def group_argmax(group_codes: "np.ndarray", values: "np.ndarray",
+                 years: "np.ndarray") -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    For integer group codes and float values, return (groups, row_index)
+    where row_index is the row holding the maximum value in each group.
+    Rows with NaN / non-positive values never win. Ties go to the earliest
+    meet year (the lifter who made it first holds the record), then row.
+    """
+    valid = np.flatnonzero(np.nan_to_num(values, nan=0.0) > 0)
+    if valid.size == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    g = group_codes[valid]
+    v = values[valid]
+    y = np.nan_to_num(years[valid], nan=9999.0)
+    # Sort by group, then value ascending, then year/row descending: the last
+    # row of each group run is the max, and on ties the earliest one
+    order = np.lexsort((-valid, -y, v, g))
+    g_sorted = g[order]
+    last = np.flatnonzero(np.r_[g_sorted[1:] != g_sorted[:-1], True])
+    return g_sorted[last], valid[order[last]]
+
+
+def encode_keys(*columns: "np.ndarray") -> tuple["np.ndarray", "np.ndarray"]:
+    """Encode tuple keys from several object columns into (uniques, codes)."""
+    joined = np.array(["|".join(parts) for parts in zip(*columns)], dtype=object)
+    return np.unique(joined.astype(str), return_inverse=True)
+
+
+def compute_records(cols: dict[str, "np.ndarray"]) -> list[dict]:
+    """Best lift per (era, sex, weight_class, lift)."""
+    keep = (cols["era"] != "") & (cols["weight_class"] != "") & cols["class_valid"]
+    idx = np.flatnonzero(keep)
+    keys, codes = encode_keys(
+        cols["era"][idx], cols["sex"][idx], cols["weight_class"][idx]
+    )
+
+    records = []
+    for lift in LIFTS:
+        groups, winners = group_argmax(codes, cols[lift][idx], cols["meet_year"][idx])
+        rows = idx[winners]
+        for key, row in zip(keys[groups], rows):
+            era, sex, weight_class = key.split("|")
+            records.append(record_row(cols, row, era, sex, weight_class, lift))
+    records.sort(key=record_sort_key)
+    return records
+
+
+def record_row(cols, row: int, era: str, sex: str, weight_class: str, lift: str) -> dict:
+    yob = cols["yob"][row]
+    return {
+        "era": era,
+        "sex": sex,
+        "weight_class": weight_class,
+        "lift": lift,
+        "weight": fmt(float(cols[lift][row])),
+        "name": cols["name"][row],
+        "yob": "" if yob != yob else str(int(yob)),
+        "meet_year": str(int(cols["meet_year"][row])),
+        "file_path": cols["file_path"][row],
+    }
+
+
+def class_sort_value(weight_class: str) -> float:
+    m = re.search(r"\d+(\.\d+)?", weight_class)
+    value = float(m.group(0)) if m else 0.0
+    return value + (1000 if weight_class.startswith("+") else 0)
+
+
+def record_sort_key(r: dict):
+    return (r["era"], r["sex"], class_sort_value(r["weight_class"]), LIFTS.index(r["lift"]))
+
+
+# ---------------------------------------------------------------------------
+# Step 3 — Incremental update
+# ---------------------------------------------------------------------------
+
+def load_records(csv_path: Path = RECORDS_CSV) -> list[dict]:
+    if not csv_path.exists():
+        return []
+    with open(csv_path, encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def beats(new: dict, current: dict) -> bool:
+    """Same ordering as group_argmax: heavier, or as heavy and made earlier."""
+    new_weight, current_weight = float(new["weight"]), float(current["weight"])
+    if new_weight != current_weight:
+        return new_weight > current_weight
+    return int(new["meet_year"]) < int(current["meet_year"])
+
+
+def merge_records(existing: list[dict], new: list[dict]) -> tuple[list[dict], list[dict]]:
+    """
+    Fold records computed from one new meet into the existing table.
+    Returns (merged, broken) where broken lists the records the meet beat.
+    """
+    merged = {(r["era"], r["sex"], r["weight_class"], r["lift"]): r for r in existing}
+    broken = []
+    for r in new:
+        key = (r["era"], r["sex"], r["weight_class"], r["lift"])
+        current = merged.get(key)
+        if current is None or beats(r, current):
+            merged[key] = r
+            broken.append(r)
+    return sorted(merged.values(), key=record_sort_key), broken
+
+
+def add_meet(path: Path):
+    """Extract one meet, update records.csv and append its rows to lifts.csv."""
+    new_rows = extract_file(path)
+    print(f"  -> {len(new_rows)} lift rows in {path.name}")
+    if not new_rows:
+        return
+
+    existing = load_records()
+    if not existing:
+        print("  (no records.csv yet — run a full recompute first)")
+        return
+
+    cols = build_columns(new_rows)
+    for i in rejected_rows(cols):
+        print(f"  (skipped {cols['sex'][i]} {cols['weight_class'][i]} {cols['name'][i]}: "
+              f"class not contested by that sex)")
+    new_records = compute_records(cols)
+    merged, broken = merge_records(existing, new_records)
+    write_records(merged, RECORDS_CSV)
+
+    lifts = [r for r in load_lifts() if r["file_path"] != new_rows[0]["file_path"]]
+    write_lifts(lifts + new_rows)
+
+    print(f"  -> {len(broken)} records set or broken")
+    for r in broken:
+        print(f"     {r['era']:10s} {r['sex']} {r['weight_class']:>7s} "
+              f"{r['lift']:6s} {r['weight']:>6s}  {r['name']}")
+
+
+def write_records(records: list[dict], csv_path: Path):
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=RECORD_FIELDS)
+        writer.writeheader()
+        writer.writerows(records)
+
+
+# ---------------------------------------------------------------------------
+# Step 4 — Diff against AllTimeAMRecords.htm
+# ---------------------------------------------------------------------------
+
+PAGE_SECTIONS = {
+    "SRMEN": ("M", False),
+    "JRMEN": ("M", True),
+    "SRWOMEN": ("F", False),
+    "JRWOMEN": ("F", True),
+}
+PAGE_LIFTS = {"SNATCH": "snatch", "CLEAN & JERK": "cj", "TOTAL": "total"}
+ANCHOR_RE = re.compile(r"<a\s+name\s*=\s*[\"']?(\w+)", re.IGNORECASE)
+INCLUDES_RE = re.compile(r"\(Includes:([^)]*)", re.IGNORECASE)
+# Results pages of open international meets: they list foreign lifters, who
+# can't hold US records. Lowercased filenames; the NAT column on these pages
+# isn't extracted, so the page itself is the only signal.
+INTERNATIONAL_FILES = {
+    "03titangames.htm",   # 2003 Titan Games, San Jose (men + women)
+    "03titanwomen.htm",   # 2003 Titan Games, women's page
+    "panammen.htm",       # Pan American Championships, men
+    "panamwmn.htm",       # Pan American Championships, women
+}
+PAGE_CLASS_RE = re.compile(r"^(\+?\d+(?:\.\d)?)\s*Kg", re.IGNORECASE)
+
+
+def parse_records_page(path: Path) -> list[dict]:
+    """
+    Parse the hand-maintained records page into rows of
+    {section, sex, junior, page_class, includes, lift, weight, name, date}.
+    """
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        html = f.read()
+
+    # Section anchors split the page; rows are tokenised per section
+    parts = ANCHOR_RE.split(html)
+    rows = []
+    for name, body in zip(parts[1::2], parts[2::2]):
+        if name.upper() not in PAGE_SECTIONS:
+            continue
+        sex, junior = PAGE_SECTIONS[name.upper()]
+        page_class, includes = "", set()
+        for cells in split_rows(body):
+            texts = [c[0] for c in cells]
+            if len(texts) == 1:
+                m = PAGE_CLASS_RE.match(texts[0])
+                if m:
+                    page_class = normalize_page_class(m.group(1))
+                    inc = INCLUDES_RE.search(texts[0])
+                    raw = inc.group(1) if inc else m.group(1)
+                    includes = {
+                        normalize_page_class(c)
+                        for c in re.findall(r"\+?\d+(?:\.\d)?", raw)
+                    }
+                    includes.add(page_class)
+                continue
+            if len(texts) >= 5 and texts[0].upper() in PAGE_LIFTS and page_class:
+                weight = re.search(r"\d+(\.\d+)?", texts[1])
+                rows.append({
+                    "section": name.upper(),
+                    "sex": sex,
+                    "junior": junior,
+                    "page_class": page_class,
+                    "includes": includes,
+                    "lift": PAGE_LIFTS[texts[0].upper()],
+                    "weight": float(weight.group(0)) if weight else None,
+                    "name": texts[2],
+                    "date": texts[4],
+                })
+    return rows
+
+
+def normalize_page_class(label: str) -> str:
+    label = label.strip()
+    plus = label.startswith("+")
+    label = label.lstrip("+")
+    if label.endswith(".0"):
+        label = label[:-2]
+    return ("+" if plus else "") + label
+
+
+def diff_records_page(cols: dict[str, "np.ndarray"], page_rows: list[dict]) -> list[dict]:
+    """
+    Compare each page record with the best archived lift in the classes it
+    covers. Junior records only consider lifters aged <= JUNIOR_MAX_AGE.
+    """
+    age = cols["meet_year"] - cols["yob"]
+    is_junior = age <= JUNIOR_MAX_AGE   # NaN compares False
+    # Press-era totals are three-lift totals and never stand as records
+    two_lift = cols["era"] != "pre-1973"
+    domestic = np.array(
+        [p.rsplit("/", 1)[-1].lower() not in INTERNATIONAL_FILES for p in cols["file_path"]],
+        dtype=bool,
+    ) & cols["class_valid"]
+
+    # One vectorised pass per (junior-only?, lift) over (sex, class) groups
+    best: dict[tuple, int] = {}
+    for junior in (False, True):
+        idx = np.flatnonzero(domestic & is_junior) if junior else np.flatnonzero(domestic)
+        keys, codes = encode_keys(cols["sex"][idx], cols["weight_class"][idx])
+        for lift in LIFTS:
+            values = cols[lift][idx]
+            if lift == "total":
+                values = np.where(two_lift[idx], values, np.nan)
+            groups, winners = group_argmax(codes, values, cols["meet_year"][idx])
+            for key, row in zip(keys[groups], idx[winners]):
+                sex, weight_class = key.split("|")
+                best[(junior, sex, weight_class, lift)] = row
+
+    diff = []
+    for p in page_rows:
+        candidates = [
+            best[k] for k in (
+                (p["junior"], p["sex"], c, p["lift"]) for c in p["includes"]
+            ) if k in best
+        ]
+        row = max(candidates, key=lambda i: cols[p["lift"]][i]) if candidates else None
+        computed = float(cols[p["lift"]][row]) if row is not None else None
+
+        if computed is None:
+            status = "missing_in_archive"
+        elif p["weight"] is None:
+            status = "unparsed_page_value"
+        elif abs(computed - p["weight"]) < 0.05:
+            status = "match"
+        elif computed > p["weight"]:
+            status = "archive_higher"
+        else:
+            status = "page_higher"
+
+        diff.append({
+            "section": p["section"],
+            "page_class": p["page_class"],
+            "lift": p["lift"],
+            "page_weight": fmt(p["weight"]),
+            "page_name": p["name"],
+            "page_date": p["date"],
+            "archive_weight": fmt(computed),
+            "archive_name": cols["name"][row] if row is not None else "",
+            "archive_meet": cols["file_path"][row] if row is not None else "",
+            "status": status,
+        })
+    return diff
+
+
+# ---------------------------------------------------------------------------
+# Step 5 — Diff against SrNatsChampsByNumber.htm
+# ---------------------------------------------------------------------------
+
+COUNT_RE = re.compile(r"\((\d+)\)")
+SR_NATS_FILE_RE = re.compile(r"^\d{2}SrNats\.htm$", re.IGNORECASE)
+
+
+def normalize_person(name: str) -> str:
+    """'TERLAZZO, ANTHONY' / 'Anthony (Tony) Terlazzo' -> 'anthony terlazzo'."""
+    name = htmllib.unescape(name)
+    name = re.sub(r"\([^)]*\)|\"[^\"]*\"", " ", name)
+    if "," in name:
+        last, _, first = name.partition(",")
+        if first.strip().upper() not in ("JR", "JR.", "SR", "III", "II"):
+            name = f"{first} {last}"
+    name = re.sub(r"\b(jr|sr|ii|iii)\b\.?", " ", name, flags=re.IGNORECASE)
+    # Middle initials: 'Chad T. Vaughn' is 'Chad Vaughn' on the page
+    name = re.sub(r"(?<!\S)[a-z]\.?(?!\S)", " ", name, flags=re.IGNORECASE)
+    name = re.sub(r"[^a-z ]", "", name.lower())
+    return " ".join(name.split())
+
+
+def parse_champs_page(path: Path) -> dict[str, tuple[str, int]]:
+    """Return {normalized name: (page name, title count)}."""
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        html = f.read()
+    champs = {}
+    for cells in split_rows(html):
+        if len(cells) != 2:
+            continue
+        m = COUNT_RE.search(cells[0][0])
+        if not m:
+            continue
+        count = int(m.group(1))
+        # Names are comma separated, but 'Oscar Chaplin, III' keeps its suffix
+        names = re.split(r",\s*(?!(?:III|II|Jr|Sr)\b)", cells[1][0])
+        for raw in names:
+            raw = raw.strip()
+            if raw:
+                champs[normalize_person(raw)] = (raw, count)
+    return champs
+
+
+def diff_champs_page(cols: dict[str, "np.ndarray"], page: dict[str, tuple[str, int]]) -> list[dict]:
+    """Count senior national titles (place 1, men) per lifter in the archive."""
+    filenames = np.array([p.rsplit("/", 1)[-1] for p in cols["file_path"]], dtype=object)
+    is_sr_nats = np.array([bool(SR_NATS_FILE_RE.match(f)) for f in filenames])
+    winners = np.flatnonzero(
+        is_sr_nats & (cols["place"] == 1) & (cols["sex"] == "M") & cols["class_valid"]
+    )
+
+    # Root and Results pools carry copies of some meets; count each
+    # (meet, class) once
+    seen = set()
+    counts: Counter = Counter()
+    display = {}
+    for i in winners:
+        key = (filenames[i].lower(), cols["weight_class"][i])
+        if key in seen:
+            continue
+        seen.add(key)
+        person = normalize_person(cols["name"][i])
+        counts[person] += 1
+        display.setdefault(person, cols["name"][i])
+
+    diff = []
+    for person in sorted(set(page) | set(counts)):
+        page_name, page_count = page.get(person, ("", 0))
+        archive_count = counts.get(person, 0)
+        if page_count == archive_count:
+            status = "match"
+        elif not page_count:
+            status = "missing_on_page"
+        elif not archive_count:
+            status = "missing_in_archive"
+        else:
+            status = "count_differs"
+        diff.append({
+            "name": page_name or display[person],
+            "page_count": page_count,
+            "archive_count": archive_count,
+            "status": status,
+        })
+    return diff
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def write_csv(rows: list[dict], csv_path: Path):
+    if not rows:
+        return
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compute archive records and diff record pages.")
+    parser.add_argument("--add", type=Path, help="fold one new meet page into records.csv")
+    args = parser.parse_args()
+
+    if not LIFTS_CSV.exists():
+        print(f"ERROR: {LIFTS_CSV} not found. Run: python scripts/extract_lifts.py")
+        sys.exit(1)
+
+    if args.add:
+        # Lift rows are keyed on the page's path inside the archive
+        if not args.add.is_file():
+            print(f"ERROR: {args.add} not found")
+            sys.exit(1)
+        if not args.add.resolve().is_relative_to(ARCHIVE_ROOT.resolve()):
+            print(f"ERROR: {args.add} must be under {ARCHIVE_ROOT.relative_to(ARCHIVE_ROOT.parent.parent)}; "
+                  f"copy the page into the archive first")
+            sys.exit(1)
+        print(f"Adding meet {args.add}...")
+        add_meet(args.add)
+        return
+
+    print(f"Loading {LIFTS_CSV.name}...")
+    rows = load_lifts()
+    cols = build_columns(rows)
+    print(f"  -> {len(rows)} lift rows")
+
+    start = time.perf_counter()
+    records = compute_records(cols)
+    elapsed = time.perf_counter() - start
+    rejected = rejected_rows(cols)
+
+    page_diff = diff_records_page(cols, parse_records_page(ALL_TIME_RECORDS_PAGE))
+    champs_diff = diff_champs_page(cols, parse_champs_page(CHAMPS_BY_NUMBER_PAGE))
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    write_records(records, RECORDS_CSV)
+    write_csv(page_diff, RECORDS_DIFF_CSV)
+    write_csv(champs_diff, CHAMPS_DIFF_CSV)
+
+    print()
+    print("=" * 50)
+    print("SUMMARY")
+    print(f"  Records computed    : {len(records)}")
+    print(f"  Full recompute      : {elapsed * 1000:.1f} ms")
+    print(f"  Rows rejected       : {len(rejected)} (class not contested by that sex)")
+    for i in rejected:
+        print(f"    {cols['file_path'][i]}  {cols['sex'][i]} {cols['weight_class'][i]:>5s}  {cols['name'][i]}")
+    print()
+    print(f"  {ALL_TIME_RECORDS_PAGE.name}:")
+    for status, count in sorted(Counter(d["status"] for d in page_diff).items()):
+        print(f"    {status:20s} {count}")
+    print(f"  {CHAMPS_BY_NUMBER_PAGE.name}:")
+    for status, count in sorted(Counter(d["status"] for d in champs_diff).items()):
+        print(f"    {status:20s} {count}")
+    print()
+    print("Output written to:")
+    print(f"  {RECORDS_CSV}")
+    print(f"  {RECORDS_DIFF_CSV}")
+    print(f"  {CHAMPS_DIFF_CSV}")
+
+
+if __name__ == "__main__":
+    main()
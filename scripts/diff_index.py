@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+diff_index.py — changeset between two index snapshots
+
+Compares an old and a new results_index / assets_index snapshot and writes
+a compact JSON changeset, so publishing can rebuild only what changed:
+
+  added    : full records present only in the new snapshot
+  removed  : keys present only in the old snapshot
+  modified : key + {field: [old, new]} for every field that differs
+
+Records are keyed on file_path (results_index) or rel_path (assets_index),
+detected from the columns (two empty snapshots need no key). Both
+snapshots are loaded into dicts, so the diff is one pass over each side.
+Snapshots can be .json or .csv, in any mix.
+Values are compared as text because CSV has no types (JSON True and
+CSV "True" are the same value).
+
+Output: scripts/output/index_diff.json  (or --out PATH, '-' for stdout)
+
+Usage (from repo root):
+    git show HEAD:scripts/output/results_index.json > /tmp/old.json
+    python scripts/index_results.py
+    python scripts/diff_index.py /tmp/old.json scripts/output/results_index.json
+    python scripts/diff_index.py old_assets.csv scripts/output/assets_index.csv --out -
+"""
+
+import argparse
+import csv
+import json
+import sys
+from pathlib import Path
+
+OUTPUT_DIR = Path(__file__).parent / "output"
+DIFF_JSON = OUTPUT_DIR / "index_diff.json"
+
+# Key column of each index, checked in order
+INDEX_KEYS = (
+    ("results_index", "file_path"),
+    ("assets_index", "rel_path"),
+)
+
+# ---------------------------------------------------------------------------
+# Step 1 — Load snapshots
+# ---------------------------------------------------------------------------
+
+def load_snapshot(path: Path) -> tuple[list[str], list[dict]]:
+    """Return (field order, records) of a .json or .csv index snapshot."""
+    if path.suffix.lower() == ".json":
+        with open(path, encoding="utf-8") as f:
+            records = json.load(f)
+        fields = list(records[0]) if records else []
+    else:
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            records = list(reader)
+            fields = list(reader.fieldnames or [])
+    return fields, records
+
+
+def detect_key(fields: list[str]) -> tuple[str, str]:
+    """(index kind, key column) for a snapshot's columns."""
+    for kind, key in INDEX_KEYS:
+        if key in fields:
+            return kind, key
+    raise ValueError(f"no key column found (expected one of "
+                     f"{', '.join(k for _, k in INDEX_KEYS)}) in {fields}")
+
+
+def keyed(records: list[dict], key: str, label: str) -> dict[str, dict]:
+    by_key = {}
+    for r in records:
+        k = r[key]
+        if k in by_key:
+            raise ValueError(f"{label}: duplicate {key} {k!r}")
+        by_key[k] = r
+    return by_key
+
+
+def as_text(value) -> str:
+    return "" if value is None else str(value)
+
+
+# ---------------------------------------------------------------------------
+# Step 2 — Diff
+# ---------------------------------------------------------------------------
+
+def diff_snapshots(old: dict[str, dict], new: dict[str, dict], fields: list[str]) -> dict:
+    """Added / removed / modified records between two keyed snapshots."""
+    added = [new[k] for k in new if k not in old]
+    removed = [k for k in old if k not in new]
+
+    modified = []
+    for k, new_rec in new.items():
+        old_rec = old.get(k)
+        if old_rec is None:
+            continue
+        changed = {}
+        for field in fields:
+            before, after = as_text(old_rec.get(field)), as_text(new_rec.get(field))
+            if before != after:
+                changed[field] = [old_rec.get(field), new_rec.get(field)]
+        if changed:
+            modified.append({"key": k, "changed": changed})
+
+    return {"added": added, "removed": removed, "modified": modified}
+
+
+def build_changeset(old_path: Path, new_path: Path) -> dict:
+    old_fields, old_records = load_snapshot(old_path)
+    new_fields, new_records = load_snapshot(new_path)
+    # New columns first in the new snapshot's order, then any that were dropped
+    fields = new_fields + [f for f in old_fields if f not in new_fields]
+    if fields:
+        kind, key = detect_key(new_fields or old_fields)
+        old_kind, _ = detect_key(old_fields or new_fields)
+        if old_kind != kind:
+            raise ValueError(f"snapshots are different indexes: {old_kind} vs {kind}")
+    else:
+        # Two empty JSON snapshots ('[]') have no columns to key on, and
+        # nothing to diff
+        kind, key = "", ""
+    diff = diff_snapshots(
+        keyed(old_records, key, str(old_path)),
+        keyed(new_records, key, str(new_path)),
+        fields,
+    )
+    return {
+        "index": kind,
+        "key": key,
+        "old": str(old_path),
+        "new": str(new_path),
+        "counts": {
+            "old": len(old_records),
+            "new": len(new_records),
+            "added": len(diff["added"]),
+            "removed": len(diff["removed"]),
+            "modified": len(diff["modified"]),
+        },
+        # Every key a consumer needs to rebuild or delete
+        "affected": sorted(
+            [r[key] for r in diff["added"]] + diff["removed"] + [m["key"] for m in diff["modified"]]
+        ),
+        **diff,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Diff two results_index / assets_index snapshots.")
+    parser.add_argument("old", type=Path, help="older snapshot (.json or .csv)")
+    parser.add_argument("new", type=Path, help="newer snapshot (.json or .csv)")
+    parser.add_argument("--out", default=str(DIFF_JSON),
+                        help=f"changeset path (default {DIFF_JSON.name}); '-' for stdout")
+    args = parser.parse_args()
+
+    for path in (args.old, args.new):
+        if not path.exists():
+            print(f"ERROR: {path} not found")
+            sys.exit(1)
+
+    try:
+        changeset = build_changeset(args.old, args.new)
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+    if args.out == "-":
+        json.dump(changeset, sys.stdout, indent=2)
+        print()
+        return
+
+    out = Path(args.out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(changeset, f, indent=2)
+
+    counts = changeset["counts"]
+    if changeset["key"]:
+        print(f"Diffing {changeset['index']} on {changeset['key']}...")
+    else:
+        print("Diffing two empty snapshots...")
+    print()
+    print("=" * 50)
+    print("SUMMARY")
+    print(f"  Old records : {counts['old']}")
+    print(f"  New records : {counts['new']}")
+    print(f"  Added       : {counts['added']}")
+    print(f"  Removed     : {counts['removed']}")
+    print(f"  Modified    : {counts['modified']}")
+    if not changeset["affected"]:
+        print("  (no changes)")
+    if changeset["modified"]:
+        print()
+        print("MODIFIED:")
+        for m in changeset["modified"]:
+            print(f"  {m['key']}: {', '.join(m['changed'])}")
+    print()
+    print(f"Output written to: {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,612 @@
+#!/usr/bin/env python3
+"""
+extract_lifts.py — LiftTilYaDie Lift Row Extractor
+
+Pulls individual lifter rows out of every archived result page indexed by
+index_results.py (root pool + Results pool, .htm only).
+
+For each lifter row it records:
+  - the meet file, meet year and the weight class / sex section it sits in
+  - name, team, YOB, bodyweight
+  - the six attempts (missed attempts stored as negative numbers)
+  - best snatch, best clean & jerk, total and placing
+
+The legacy pages leave most <TD>/<TR> tags unclosed, which html.parser nests
+into one deep tree, so rows are tokenised with regexes instead of BeautifulSoup.
+
+Output: scripts/output/lifts.csv
+
+Usage (from repo root):
+    python scripts/extract_lifts.py
+"""
+
+import csv
+import html as htmllib
+import re
+import sys
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from index_results import (  # noqa: E402
+    DATE_MONTH_YEAR_RE,
+    DATE_RANGE_RE,
+    DATE_SINGLE_RE,
+    OUTPUT_DIR,
+    REPO_ROOT,
+    collect_files,
+    year_from_filename,
+)
+
+# ---------------------------------------------------------------------------
+# Paths
+# ---------------------------------------------------------------------------
+
+LIFTS_CSV = OUTPUT_DIR / "lifts.csv"
+
+# Champions lists and record tables sit in Results/ but aren't meets
+REFERENCE_PAGE_RE = re.compile(r"^(SrNats|WomenNat|AAU)Champs|Records\.htm$", re.IGNORECASE)
+
+LIFT_FIELDS = [
+    "file_path", "meet_year", "sex", "weight_class",
+    "name", "team", "yob", "bwt",
+    "sn1", "sn2", "sn3", "cj1", "cj2", "cj3",
+    "snatch", "cj", "total", "place", "units",
+]
+
+# ---------------------------------------------------------------------------
+# Step 1 — Tokenise legacy table markup
+# ---------------------------------------------------------------------------
+
+TR_SPLIT_RE = re.compile(r"<tr\b[^>]*>", re.IGNORECASE)
+TD_SPLIT_RE = re.compile(r"<t[dh]\b([^>]*)>", re.IGNORECASE)
+TABLE_END_RE = re.compile(r"</table\s*>", re.IGNORECASE)
+COLSPAN_RE = re.compile(r"colspan\s*=\s*[\"']?(\d+)", re.IGNORECASE)
+TAG_RE = re.compile(r"<[^>]+>")
+STRUCK_RE = re.compile(r"<(s|strike|del)\b|color\s*=\s*[\"']?#?(ff0000|red)\b", re.IGNORECASE)
+WS_RE = re.compile(r"\s+")
+
+
+def cell_text(raw: str) -> str:
+    """Strip tags/entities from a raw cell fragment and collapse whitespace."""
+    text = htmllib.unescape(TAG_RE.sub(" ", raw)).replace("\xa0", " ")
+    return WS_RE.sub(" ", text).strip()
+
+
+def split_rows(html: str) -> list[list[tuple[str, int, bool]]]:
+    """
+    Split a page into rows of cells.
+    Each cell is (text, colspan, struck) where struck marks a missed attempt.
+    """
+    rows = []
+    for chunk in TR_SPLIT_RE.split(html)[1:]:
+        # A row never extends past the end of its table
+        chunk = TABLE_END_RE.split(chunk, 1)[0]
+        parts = TD_SPLIT_RE.split(chunk)
+        # parts = [before, attrs1, body1, attrs2, body2, ...]
+        cells = []
+        for i in range(1, len(parts) - 1, 2):
+            attrs, body = parts[i], parts[i + 1]
+            m = COLSPAN_RE.search(attrs)
+            colspan = int(m.group(1)) if m else 1
+            cells.append((cell_text(body), colspan, bool(STRUCK_RE.search(body))))
+        if cells:
+            rows.append(cells)
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# Step 2 — Header detection and column mapping
+# ---------------------------------------------------------------------------
+
+# Header label -> canonical column (checked in order, first match wins)
+HEADER_LABELS = [
+    (re.compile(r"^(NAME|LIFTER|ATHLETE)\b"), "name"),
+    (re.compile(r"^(TEAM|CLUB|SCHOOL|STATE|HOMETOWN|AFFILIATION)\b"), "team"),
+    (re.compile(r"^(BWT|BODY ?WEIGHT|BW|WEIGHT)\b"), "bwt"),
+    (re.compile(r"^(YOB|Y O B|BORN)\b"), "yob"),
+    (re.compile(r"^AGE\b"), "age"),
+    (re.compile(r"^(SNATCH|SN)\b"), "sn"),
+    (re.compile(r"^(CLEAN ?& ?JERK|C ?& ?J|CL ?& ?JK|CJ)\b"), "cj"),
+    (re.compile(r"^(TOTAL|TOT)\b"), "total"),
+    (re.compile(r"^(PL|PLACE)\b"), "place"),
+    (re.compile(r"^(CL|CLASS|CAT)\b"), "class"),
+    (re.compile(r"^PRESS\b"), "press"),
+    (re.compile(r"^SINCLAIR\b"), "sinclair"),
+]
+
+
+def header_columns(cells: list[tuple[str, int, bool]]) -> list[str] | None:
+    """
+    Return the expanded column layout for a header row, or None if the row
+    is not a results header. SNATCH/C&J spanning 3 columns become attempts.
+    """
+    labels = [c[0].upper() for c in cells]
+    if not any(l.startswith(("NAME", "LIFTER", "ATHLETE")) for l in labels):
+        return None
+    if not any(l.startswith(("SNATCH", "TOTAL")) for l in labels):
+        return None
+
+    columns = []
+    for text, colspan, _ in cells:
+        label = text.upper()
+        col = "skip"
+        for pattern, name in HEADER_LABELS:
+            if pattern.match(label):
+                col = name
+                break
+        if col in ("sn", "cj") and colspan >= 3:
+            columns.extend(f"{col}{i}" for i in range(1, colspan + 1))
+        else:
+            columns.extend([col] * colspan)
+    return columns
+
+
+CLASS_RE = re.compile(
+    r"(\+?\s*\d{2,3}(?:\.\d)?)\s*(?:&#189;|\xbd)?\s*(\+)?\s*(KG|KILO|LB|POUND)",
+    re.IGNORECASE,
+)
+# '+105 MEN' — no unit, but the sex word makes it a class row
+BARE_CLASS_RE = re.compile(
+    r"^(\+?\s*\d{2,3}(?:\.\d)?)\s*(\+)?()\s+(?=(?:WOMEN|MEN|GIRLS|BOYS)\b)",
+    re.IGNORECASE,
+)
+# 'WOMEN', '13 & UNDER GIRLS' or 'MEN 16 & 17'
+SEX_ROW_RE = re.compile(
+    r"^(WOMEN|MEN|GIRLS|BOYS)(?:'?S)?\b|(?:^|\s)(WOMEN|MEN|GIRLS|BOYS)(?:'?S)?$", re.IGNORECASE
+)
+OVER_RE = re.compile(r"\b(&|AND)\s*OVER\b", re.IGNORECASE)
+WOMEN_RE = re.compile(r"\b(WOMEN|WOMAN|FEMALE|GIRLS)\b", re.IGNORECASE)
+MEN_RE = re.compile(r"\b(MEN|MALE|BOYS)\b", re.IGNORECASE)
+
+NAMED_CLASS_RE = re.compile(
+    r"^((?:Super[- ]?|Light[- ]?|Middle[- ]?)?(?:Fly|Bantam|Feather|Light|Middle|Heavy)weight)\b",
+    re.IGNORECASE,
+)
+KG_MENTION_RE = re.compile(r"\b(KG|KGS|KILO)", re.IGNORECASE)
+LB_MENTION_RE = re.compile(r"\b(LB|LBS|POUNDS?)\b", re.IGNORECASE)
+LB_ERA_END = 1975      # AAU meets without a 'Kg' anywhere are in pounds before this
+
+# Senior bodyweight classes (first year, men, women), newest first; the
+# years match compute_records.ERAS. A class only one sex contests gives the
+# sex of a row on pages that don't say it. Before 1998 the two sets differ
+# only at the extremes (46/50/+83, 44/48/+82.5), which double as boys'
+# age-group classes, so those eras infer nothing.
+SENIOR_CLASSES = [
+    (2019, {"55", "61", "67", "73", "81", "89", "96", "102", "109", "+109"},
+           {"45", "49", "55", "59", "64", "71", "76", "81", "87", "+87"}),
+    (1998, {"56", "62", "69", "77", "85", "94", "105", "+105"},
+           {"48", "53", "58", "63", "69", "75", "+75", "90", "+90"}),
+    (1993, set(), set()),
+]
+
+LB_TO_KG = 0.45359237
+MAX_LIFT_KG = 300.0
+MAX_TOTAL_KG = 700.0      # three-lift (press era) totals included
+
+
+def normalize_class(label: str) -> str:
+    """'75.0' -> '75', '105+' -> '+105'; lb classes keep an 'lb' suffix."""
+    label = label.replace(" ", "")
+    plus = "+" in label
+    label = label.strip("+")
+    if label.endswith(".0"):
+        label = label[:-2]
+    return ("+" if plus else "") + label
+
+
+def class_value(weight_class: str) -> float | None:
+    """Ordering value of a class ('+105' sorts after '105'); None if not numeric."""
+    m = re.match(r"^(\+?)(\d+(?:\.\d+)?)(lb)?$", weight_class)
+    if not m:
+        return None
+    return float(m.group(2)) + (1000 if m.group(1) else 0)
+
+
+def sex_only_class(year: int | str, weight_class: str) -> str:
+    """'M' / 'F' when only that sex has weight_class among the senior classes of year's era."""
+    try:
+        year = int(year)
+    except (TypeError, ValueError):
+        return ""
+    for start, men, women in SENIOR_CLASSES:
+        if year >= start:
+            if weight_class in men and weight_class not in women:
+                return "M"
+            if weight_class in women and weight_class not in men:
+                return "F"
+            return ""
+    return ""
+
+
+def class_valid(year: int | str, sex: str, weight_class: str) -> bool:
+    """False when weight_class is a senior class of the other sex only."""
+    only = sex_only_class(year, weight_class)
+    return not only or only == sex
+
+
+def parse_class_row(cells: list[tuple[str, int, bool]]) -> tuple[str, str, str] | None:
+    """
+    Recognise a section row such as '48 KG WOMEN', '+105 Kg' or '123 Lb. Class'.
+    Returns (weight_class, sex, units) where sex may be '' if the row doesn't say.
+    """
+    texts = [c[0] for c in cells if c[0]]
+    if len(texts) != 1:
+        return None
+    text = texts[0]
+    m = CLASS_RE.search(text) or BARE_CLASS_RE.search(text)
+    if not m or len(text) > 60:
+        return None
+    units = "lb" if m.group(3) and not m.group(3).upper().startswith("K") else "kg"
+    weight_class = m.group(1)
+    if m.group(2) or OVER_RE.search(text):
+        weight_class = "+" + weight_class
+    weight_class = normalize_class(weight_class)
+    if units == "lb":
+        weight_class += "lb"
+    sex = "F" if WOMEN_RE.search(text) else "M" if MEN_RE.search(text) else ""
+    return weight_class, sex, units
+
+
+def parse_sex_row(cells: list[tuple[str, int, bool]]) -> str | None:
+    """
+    Recognise session rows such as 'WOMEN' or '13 & UNDER GIRLS', which may
+    share a row with the '1 2 3' attempt sub-header.
+    """
+    texts = [c[0] for c in cells if c[0]]
+    if not texts or len(texts[0]) > 40:
+        return None
+    m = SEX_ROW_RE.search(texts[0])
+    if not m:
+        return None
+    return "F" if WOMEN_RE.match(m.group(1) or m.group(2)) else "M"
+
+
+def parse_named_class_row(cells: list[tuple[str, int, bool]]) -> str | None:
+    """Recognise old AAU section rows such as 'Bantamweight Class'."""
+    texts = [c[0] for c in cells if c[0]]
+    if len(texts) != 1 or len(texts[0]) > 40:
+        return None
+    m = NAMED_CLASS_RE.match(texts[0])
+    return m.group(1).lower().replace(" ", "").replace("-", "") if m else None
+
+
+# ---------------------------------------------------------------------------
+# Step 3 — Value parsing
+# ---------------------------------------------------------------------------
+
+NUMBER_RE = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+def parse_number(text: str) -> float | None:
+    m = NUMBER_RE.search(text.replace(",", "."))
+    return float(m.group(0)) if m else None
+
+
+def parse_attempt(text: str, struck: bool) -> float | None:
+    """Attempt weight; misses are negative. Blank / '-' / 'X' -> None."""
+    value = parse_number(text)
+    if value is None:
+        return None
+    value = abs(value)
+    if value == 0:
+        return 0.0
+    return -value if struck or text.strip().startswith("-") else value
+
+
+def best_of(attempts: list[float | None]) -> float | None:
+    made = [a for a in attempts if a is not None and a > 0]
+    if made:
+        return max(made)
+    if any(a is not None for a in attempts):
+        return 0.0
+    return None
+
+
+def plausible(value: float | None, limit: float) -> float | None:
+    """Drop values no lifter has ever made — typos such as '900.' for 90.0."""
+    if value is None or abs(value) > limit:
+        return None
+    return value
+
+
+def to_kg(value: float | None) -> float | None:
+    """Convert pounds to kg, rounded to 0.1 kg."""
+    return None if value is None else round(value * LB_TO_KG, 1)
+
+
+def fmt(value: float | None) -> str:
+    """Render a number for CSV: '' for missing, no trailing '.0' clutter."""
+    if value is None:
+        return ""
+    return f"{value:g}"
+
+
+# ---------------------------------------------------------------------------
+# Step 4 — Page extraction
+# ---------------------------------------------------------------------------
+
+def meet_year(html: str, filename: str) -> str:
+    """Meet year from the first date in the page head, else the filename."""
+    head = cell_text(html[:6000])
+    for pattern, group in ((DATE_RANGE_RE, 4), (DATE_SINGLE_RE, 3), (DATE_MONTH_YEAR_RE, 2)):
+        m = pattern.search(head)
+        if m:
+            return m.group(group)
+    return year_from_filename(filename) or ""
+
+
+def page_default_sex(html: str, filename: str) -> str:
+    title = cell_text(html[:3000]).upper()
+    if "WMN" in filename.upper() or "WOMEN" in filename.upper() or WOMEN_RE.search(title) and not MEN_RE.search(title):
+        return "F"
+    return "M"
+
+
+def page_default_units(html: str, year: str) -> str:
+    """Pages that never mention kilos are in pounds if old or if they say so."""
+    if KG_MENTION_RE.search(html):
+        return "kg"
+    if LB_MENTION_RE.search(html) or (year and int(year) < LB_ERA_END):
+        return "lb"
+    return "kg"
+
+
+def new_session(start: str) -> dict:
+    """A run of rows sharing one sex; start is 'page', 'sex', 'restart' or 'flip'."""
+    return {"start": start, "said": Counter(), "classes": Counter(), "class_sex": "", "class_rows": 0}
+
+
+def session_sexes(sessions: list[dict], year: str, default_sex: str) -> list[str]:
+    """
+    Sex of each session: what its sex words say (majority, so one mislabelled
+    class row can't flip it), else what its sex-only classes say, else the
+    previous session's sex (the page default for the first).
+    """
+    sexes, sex = [], default_sex
+    for session in sessions:
+        if session["said"]:
+            sex = session["said"].most_common(1)[0][0]
+        else:
+            votes = Counter()
+            for wc, n in session["classes"].items():
+                only = sex_only_class(year, wc)
+                if only:
+                    votes[only] += n
+            if votes:
+                sex = votes.most_common(1)[0][0]
+        sexes.append(sex)
+    # '64 Kg WOMEN' alone inside the men's classes is a typo, not a session
+    for i in range(1, len(sessions) - 1):
+        if (sessions[i]["start"] == "flip" and sessions[i]["class_rows"] == 1
+                and sessions[i + 1]["start"] == "flip" and sexes[i - 1] == sexes[i + 1]):
+            sexes[i] = sexes[i - 1]
+    return sexes
+
+
+def row_sex(session: dict, session_sex: str, year: str, weight_class: str, listed: bool) -> str:
+    """
+    Summary tables (best lifters, team selections) mix sexes under whatever
+    heading precedes them, so a sex-only class overrides the session for
+    rows that list their own class or sit in a session without sex words.
+    """
+    if session["said"] and not listed:
+        return session_sex
+    return sex_only_class(year, weight_class) or session_sex
+
+
+def extract_rows(html: str, file_path: str, filename: str) -> list[dict]:
+    """
+    Extract lifter rows from one result page.
+
+    Rows are grouped into sessions, which start at a sex row ('WOMEN',
+    'MEN 16 & 17') or where the class sequence restarts ('+75 Kg' then
+    '56 Kg'); each session's sex is settled once the page is read.
+    """
+    year = meet_year(html, filename)
+    default_sex = page_default_sex(html, filename)
+    default_units = page_default_units(html, year)
+    columns: list[str] | None = None
+    weight_class, units = "", default_units
+    sessions = [new_session("page")]
+    last_class: float | None = None
+    out, out_sessions = [], []
+
+    def next_class(wc: str):
+        """Start a new session when the class sequence goes back down."""
+        nonlocal last_class
+        value = class_value(wc)
+        if value is None:
+            return
+        if last_class is not None and value < last_class:
+            sessions.append(new_session("restart"))
+        last_class = value
+
+    for cells in split_rows(html):
+        cols = header_columns(cells)
+        if cols:
+            columns = cols
+            continue
+
+        section = parse_class_row(cells)
+        if section:
+            # '108+ Kg Class' after '108 Kg MEN' is still the men's session
+            weight_class, section_sex, units = section
+            next_class(weight_class)
+            if section_sex:
+                # '75 Kg WOMEN' then '94 Kg MEN' with no restart
+                if sessions[-1]["class_sex"] not in ("", section_sex):
+                    sessions.append(new_session("flip"))
+                sessions[-1]["said"][section_sex] += 1
+                sessions[-1]["class_sex"] = section_sex
+            sessions[-1]["class_rows"] += 1
+            continue
+
+        session_sex = parse_sex_row(cells)
+        if session_sex:
+            sessions.append(new_session("sex"))
+            sessions[-1]["said"][session_sex] += 1
+            last_class = None
+            continue
+
+        named = parse_named_class_row(cells)
+        if named:
+            weight_class, units = named, default_units
+            continue
+
+        if columns is None:
+            continue
+        # Footnotes ('* - NAME - SENIOR AMERICAN RECORD ...') span the table
+        if sum(1 for c in cells if c[0]) < 2:
+            continue
+
+        # Expand the row to the header layout
+        expanded: list[tuple[str, bool]] = []
+        for text, colspan, struck in cells:
+            expanded.extend([(text, struck)] * colspan)
+        if len(expanded) < len(columns) - 1 or len(expanded) > len(columns) + 1:
+            continue
+        values = dict()
+        for col, (text, struck) in zip(columns, expanded):
+            values.setdefault(col, (text, struck))
+
+        name = values.get("name", ("", False))[0]
+        if not name or name.upper().startswith(("NAME", "&")) or not re.search(r"[A-Za-z]", name):
+            continue
+
+        sn = [parse_attempt(*values[c]) if c in values else None for c in ("sn1", "sn2", "sn3")]
+        cj = [parse_attempt(*values[c]) if c in values else None for c in ("cj1", "cj2", "cj3")]
+        snatch = best_of(sn) if "sn1" in values else parse_number(values.get("sn", ("", False))[0])
+        clean_jerk = best_of(cj) if "cj1" in values else parse_number(values.get("cj", ("", False))[0])
+        total = parse_number(values.get("total", ("", False))[0])
+        if snatch is None and clean_jerk is None and total is None:
+            continue
+
+        bwt = parse_number(values.get("bwt", ("", False))[0])
+        yob = parse_number(values.get("yob", ("", False))[0])
+        # Some pages label YOB/BWT in one order and fill them in the other
+        if bwt is not None and yob is not None and yob != int(yob) and bwt == int(bwt) and bwt < 100:
+            bwt, yob = yob, bwt
+        if yob is not None:
+            yob = int(yob)
+            if yob < 100:
+                yob += 1900 if yob > 20 else 2000
+            if not 1850 <= yob <= 2020:
+                yob = None
+        row_class, listed = weight_class, False
+        if "class" in values:
+            m = re.search(r"\+?\d{2,3}(?:\.\d)?\+?", values["class"][0])
+            if m:
+                row_class, listed = normalize_class(m.group(0)), True
+                next_class(row_class)
+        sessions[-1]["classes"][row_class] += 1
+        out_sessions.append((len(sessions) - 1, listed))
+
+        # Pound-era pages: store every weight in kg so classes/eras compare
+        if units == "lb":
+            sn = [to_kg(a) for a in sn]
+            cj = [to_kg(a) for a in cj]
+            snatch, clean_jerk, total = to_kg(snatch), to_kg(clean_jerk), to_kg(total)
+            bwt = to_kg(bwt)
+        if bwt is not None and not 20 <= bwt <= 250:
+            bwt = None
+        sn, cj = [plausible(a, MAX_LIFT_KG) for a in sn], [plausible(a, MAX_LIFT_KG) for a in cj]
+        snatch, clean_jerk = plausible(snatch, MAX_LIFT_KG), plausible(clean_jerk, MAX_LIFT_KG)
+        total = plausible(total, MAX_TOTAL_KG)
+        # A best lift above the total is a typo on the page ('4375' for 43.75)
+        if total:
+            if snatch and snatch > total:
+                snatch = None
+            if clean_jerk and clean_jerk > total:
+                clean_jerk = None
+            # Even 'top 2 snatches + top 2 C&Js' age-group totals stay under this
+            if snatch and clean_jerk and total > 2 * (snatch + clean_jerk):
+                total = None
+
+        place = parse_number(values.get("place", ("", False))[0])
+
+        out.append({
+            "file_path": file_path,
+            "meet_year": year,
+            "sex": "",
+            "weight_class": row_class,
+            "name": name,
+            "team": values.get("team", ("", False))[0],
+            "yob": "" if yob is None else str(yob),
+            "bwt": fmt(bwt),
+            "sn1": fmt(sn[0]), "sn2": fmt(sn[1]), "sn3": fmt(sn[2]),
+            "cj1": fmt(cj[0]), "cj2": fmt(cj[1]), "cj3": fmt(cj[2]),
+            "snatch": fmt(snatch),
+            "cj": fmt(clean_jerk),
+            "total": fmt(total),
+            "place": "" if place is None else str(int(place)),
+            "units": units,
+        })
+
+    sexes = session_sexes(sessions, year, default_sex)
+    for row, (i, listed) in zip(out, out_sessions):
+        row["sex"] = row_sex(sessions[i], sexes[i], year, row["weight_class"], listed)
+    return out
+
+
+def extract_file(path: Path) -> list[dict]:
+    """Extract lifter rows from a result page on disk."""
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        html = f.read()
+    file_path = str(path.resolve().relative_to(REPO_ROOT.resolve())).replace("\\", "/")
+    return extract_rows(html, file_path, path.name)
+
+
+def load_lifts(csv_path: Path = LIFTS_CSV) -> list[dict]:
+    """Load a previously written lifts.csv."""
+    with open(csv_path, encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def write_lifts(rows: list[dict], csv_path: Path = LIFTS_CSV):
+    csv_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=LIFT_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    print("Collecting result files...")
+    files = [
+        e for e in collect_files()
+        if e["path"].suffix.lower() in (".htm", ".html")
+        and not REFERENCE_PAGE_RE.search(e["path"].name)
+    ]
+    print(f"  -> {len(files)} HTML result pages")
+
+    rows = []
+    pages_with_rows = 0
+    for i, entry in enumerate(files):
+        if (i + 1) % 50 == 0:
+            print(f"  Extracting file {i+1}/{len(files)}...")
+        page_rows = extract_file(entry["path"])
+        if page_rows:
+            pages_with_rows += 1
+        rows.extend(page_rows)
+
+    write_lifts(rows)
+
+    print()
+    print("=" * 50)
+    print("SUMMARY")
+    print(f"  Pages scanned       : {len(files)}")
+    print(f"  Pages with lifts    : {pages_with_rows}")
+    print(f"  Lift rows extracted : {len(rows)}")
+    print(f"  Rows with bodyweight: {sum(1 for r in rows if r['bwt'])}")
+    print()
+    print(f"Output written to: {LIFTS_CSV}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+geocode_meets.py — LiftTilYaDie Offline Meet Geocoding
+
+Normalises the free-text `location` of every indexed meet (e.g.
+"BUFFALO, NY", "Sacramento State University, Sacramento, CA",
+"USA WEIGHTLIFTING SENIOR NATIONALS Saint Joseph, MO") against the bundled
+gazetteer in scripts/data/gazetteer.csv and attaches a place ID and
+coordinates. No network calls.
+
+Lookup:
+  1. "..., ST" / "..., State" -> longest city name (or alias) that ENDS the
+     text before the comma, via a reversed-token trie per state; meet names
+     in front of the city ("SENIOR NATIONALS Frederick, MD") are skipped
+     over. No city match -> state centre (match = state).
+  2. no usable state      -> scan for a city / venue name anywhere in the
+     text via a forward-token trie (match = place), e.g.
+     "Marin Training Center" or "Sacramento Open".
+Repeated location strings are answered from an LRU memo.
+
+Output: scripts/output/meets_geo.csv  +  scripts/output/meets.geojson
+
+Usage (from repo root):
+    python scripts/geocode_meets.py
+    python scripts/geocode_meets.py --input scripts/output/sections_index.json
+    python scripts/geocode_meets.py --lookup "Sacramento State University - Sacramento, CA"
+"""
+
+import argparse
+import csv
+import json
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+
+# ---------------------------------------------------------------------------
+# Paths
+# ---------------------------------------------------------------------------
+
+SCRIPTS_DIR    = Path(__file__).parent
+GAZETTEER_CSV  = SCRIPTS_DIR / "data" / "gazetteer.csv"
+OUTPUT_DIR     = SCRIPTS_DIR / "output"
+RESULTS_JSON   = OUTPUT_DIR / "results_index.json"
+GEO_CSV        = OUTPUT_DIR / "meets_geo.csv"
+GEO_JSON       = OUTPUT_DIR / "meets.geojson"
+
+# Record fields carried into the outputs when the input has them
+CARRIED_FIELDS = [
+    "filename", "file_path", "section", "anchor", "meet_name",
+    "date_start", "date_end", "location",
+]
+GEO_FIELDS = ["city", "state", "place_id", "lat", "lon", "match"]
+
+# ---------------------------------------------------------------------------
+# Step 1 — Tokens and tries
+# ---------------------------------------------------------------------------
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+# Abbreviations folded so "St. Joseph" and "Saint Joseph" are one key
+TOKEN_SYNONYMS = {"st": "saint", "ste": "sainte", "mt": "mount", "ft": "fort"}
+
+END = ""   # trie key marking "a place name ends here"
+
+
+class Place(NamedTuple):
+    place_id: str
+    kind: str
+    name: str
+    state: str
+    lat: float
+    lon: float
+
+
+def tokens(text: str) -> list[str]:
+    text = text.lower().replace("'", "")
+    return [TOKEN_SYNONYMS.get(t, t) for t in TOKEN_RE.findall(text)]
+
+
+def trie_insert(trie: dict, words: list[str], place_id: str):
+    node = trie
+    for w in words:
+        node = node.setdefault(w, {})
+    node[END] = place_id
+
+
+def longest_match(trie: dict, words: list[str], start: int = 0) -> tuple[str, int]:
+    """Longest name in trie starting at words[start]: (place_id, length) or ('', 0)."""
+    node, best = trie, ("", 0)
+    for i in range(start, len(words)):
+        node = node.get(words[i])
+        if node is None:
+            break
+        if END in node:
+            best = (node[END], i - start + 1)
+    return best
+
+
+# ---------------------------------------------------------------------------
+# Step 2 — Load the gazetteer
+# ---------------------------------------------------------------------------
+
+class Gazetteer(NamedTuple):
+    places: dict[str, Place]          # place_id -> Place
+    states: dict[str, str]            # "ca" / "california" -> state place_id
+    state_codes: dict[str, str]       # state place_id -> "CA"
+    city_tries: dict[str, dict]       # "CA" -> reversed-token trie of its cities
+    phrase_trie: dict                 # forward-token trie of cities + venues
+
+
+@lru_cache(maxsize=1)
+def load_gazetteer(csv_path: Path = GAZETTEER_CSV) -> Gazetteer:
+    places: dict[str, Place] = {}
+    states: dict[str, str] = {}
+    state_codes: dict[str, str] = {}
+    city_tries: dict[str, dict] = {}
+    phrase_trie: dict = {}
+    phrase_owner: dict[tuple[str, ...], str] = {}
+
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            place = Place(row["place_id"], row["kind"], row["name"], row["state"],
+                          float(row["lat"]), float(row["lon"]))
+            places[place.place_id] = place
+
+            if place.kind == "state":
+                states[place.state.lower()] = place.place_id
+                states[" ".join(tokens(place.name))] = place.place_id
+                state_codes[place.place_id] = place.state
+                continue
+
+            aliases = [a for a in row["aliases"].split("|") if a]
+            trie = city_tries.setdefault(place.state, {})
+            for name in [place.name] + aliases:
+                words = tokens(name)
+                trie_insert(trie, words[::-1], place.place_id)
+                # Free-text scan only trusts names that are unambiguous
+                # nationally; one-word aliases ("Paul" for St. Paul) are
+                # only safe next to their state
+                if name in aliases and len(words) < 2:
+                    continue
+                key = tuple(words)
+                if phrase_owner.setdefault(key, place.place_id) != place.place_id:
+                    phrase_owner[key] = ""
+    for words, place_id in phrase_owner.items():
+        if place_id:
+            trie_insert(phrase_trie, list(words), place_id)
+
+    return Gazetteer(places, states, state_codes, city_tries, phrase_trie)
+
+
+# ---------------------------------------------------------------------------
+# Step 3 — Geocode one location string
+# ---------------------------------------------------------------------------
+
+def parse_state(gaz: Gazetteer, tail: str) -> str:
+    """State code for the text after the last comma, or ''."""
+    place_id = gaz.states.get(" ".join(tokens(tail)))
+    return gaz.state_codes.get(place_id, "") if place_id else ""
+
+
+def scan_phrases(gaz: Gazetteer, words: list[str]) -> str:
+    """Place ID of the first (longest) known name anywhere in words."""
+    for i in range(len(words)):
+        place_id, _ = longest_match(gaz.phrase_trie, words, i)
+        if place_id:
+            return place_id
+    return ""
+
+
+@lru_cache(maxsize=4096)
+def geocode(location: str) -> tuple[Place | None, str]:
+    """Return (place, match) with match in city / state / place / ''."""
+    gaz = load_gazetteer()
+    text = " ".join(location.split())
+    if not text:
+        return None, ""
+
+    head, _, tail = text.rpartition(",")
+    state = parse_state(gaz, tail) if head else ""
+    if state:
+        reversed_words = tokens(head)[::-1]
+        place_id, _ = longest_match(gaz.city_tries.get(state, {}), reversed_words)
+        if place_id:
+            return gaz.places[place_id], "city"
+        return gaz.places[gaz.states[state.lower()]], "state"
+
+    place_id = scan_phrases(gaz, tokens(text))
+    if place_id:
+        return gaz.places[place_id], "place"
+    return None, ""
+
+
+def geocode_record(record: dict) -> dict:
+    out = {k: record[k] for k in CARRIED_FIELDS if k in record}
+    place, match = geocode(record.get("location") or "")
+    out.update({
+        "city": place.name if place and place.kind == "city" else "",
+        "state": place.state if place else "",
+        "place_id": place.place_id if place else "",
+        "lat": place.lat if place else "",
+        "lon": place.lon if place else "",
+        "match": match,
+    })
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Step 4 — GeoJSON
+# ---------------------------------------------------------------------------
+
+def to_geojson(rows: list[dict]) -> dict:
+    features = []
+    for r in rows:
+        if not r["place_id"]:
+            continue
+        features.append({
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [r["lon"], r["lat"]]},
+            "properties": {k: v for k, v in r.items() if k not in ("lat", "lon")},
+        })
+    return {"type": "FeatureCollection", "features": features}
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Geocode indexed meets against the bundled gazetteer.")
+    parser.add_argument("--input", type=Path, default=RESULTS_JSON,
+                        help=f"index JSON with a location field (default {RESULTS_JSON.name})")
+    parser.add_argument("--lookup", metavar="TEXT", help="geocode one location string and exit")
+    args = parser.parse_args()
+
+    if args.lookup is not None:
+        place, match = geocode(args.lookup)
+        print(json.dumps({"match": match, **(place._asdict() if place else {})}, indent=2))
+        return
+
+    if not args.input.exists():
+        print(f"ERROR: {args.input} not found. Run: python scripts/index_results.py")
+        sys.exit(1)
+
+    gaz = load_gazetteer()
+    print(f"Gazetteer: {len(gaz.places)} places ({len(gaz.state_codes)} states)")
+    with open(args.input, encoding="utf-8") as f:
+        records = json.load(f)
+    print(f"Geocoding {len(records)} records from {args.input.name}...")
+
+    rows = [geocode_record(r) for r in records]
+    fieldnames = [k for k in CARRIED_FIELDS if rows and k in rows[0]] + GEO_FIELDS
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    with open(GEO_CSV, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+    geojson = to_geojson(rows)
+    with open(GEO_JSON, "w", encoding="utf-8") as f:
+        json.dump(geojson, f, indent=2)
+
+    matches = {m: sum(1 for r in rows if r["match"] == m) for m in ("city", "place", "state", "")}
+    memo = geocode.cache_info()
+    print()
+    print("=" * 50)
+    print("SUMMARY")
+    print(f"  Records              : {len(rows)}")
+    print(f"  City match           : {matches['city']}")
+    print(f"  Place/venue match    : {matches['place']}")
+    print(f"  State centre only    : {matches['state']}")
+    print(f"  Unresolved           : {matches['']}")
+    print(f"  Distinct places      : {len({r['place_id'] for r in rows if r['place_id']})}")
+    print(f"  Memo hits / misses   : {memo.hits} / {memo.misses}")
+    print()
+    print("UNRESOLVED LOCATIONS:")
+    for loc in sorted({r.get("location", "") for r in rows if not r["match"] and r.get("location")}):
+        print(f"  {loc}")
+    print()
+    print(f"Output written to:")
+    print(f"  {GEO_CSV}")
+    print(f"  {GEO_JSON}  ({len(geojson['features'])} features)")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,11 +18,16 @@ Output: scripts/output/assets_index.csv
 
 Usage (from repo root):
     python scripts/index_assets.py
+    python scripts/index_assets.py --shard 2/4   # one shard of a split run;
+                                                 # combine with merge_shards.py
+    python scripts/index_assets.py --pack        # read from LiftTilYaDie.pack
 """
 
+import argparse
 import csv
 import re
 import sys
+from collections import Counter
 from pathlib import Path
 
 try:
@@ -31,6 +36,11 @@ except ImportError:
     print("ERROR: beautifulsoup4 not installed. Run: pip install beautifulsoup4")
     sys.exit(1)
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from archive_io import DEFAULT_PACK, LooseArchive, PackArchive, open_archive  # noqa: E402
+from sharding import in_shard, parse_shard, write_shard  # noqa: E402
+
 # ---------------------------------------------------------------------------
 # Paths
 # ---------------------------------------------------------------------------
@@ -107,14 +117,15 @@ def normalize_ref(ref: str) -> str:
     return ref
 
 
-def get_w8lift_references(path: Path) -> dict[str, list[str]]:
+def get_w8lift_references(path: Path,
+                          archive: LooseArchive | PackArchive | None = None) -> dict[str, list[str]]:
     """
     Parse w8lift.htm and return a dict mapping normalized relative path
     to a list of reference types, e.g.:
       {'results/96marin.htm': ['href'], 'shoe2.gif': ['img_src']}
     """
-    with open(path, "r", encoding="utf-8", errors="replace") as f:
-        soup = BeautifulSoup(f, "html.parser")
+    archive = archive or LooseArchive()
+    soup = BeautifulSoup(archive.read_text(path), "html.parser")
 
     refs: dict[str, list[str]] = {}
 
@@ -169,15 +180,12 @@ def load_results_index_filenames(csv_path: Path) -> set[str]:
 # Step 3 — Walk the entire tree
 # ---------------------------------------------------------------------------
 
-def walk_archive(root: Path):
+def walk_archive(root: Path, archive: LooseArchive | PackArchive | None = None):
     """
     Yield (path, rel_path_str) for every file under root, recursively.
     rel_path_str is POSIX-style, relative to root (no leading slash).
     """
-    for p in sorted(root.rglob("*")):
-        if p.is_file():
-            rel = p.relative_to(root).as_posix()
-            yield p, rel
+    yield from (archive or LooseArchive(root)).walk()
 
 
 # ---------------------------------------------------------------------------
@@ -188,14 +196,19 @@ def build_inventory(
     archive_root: Path,
     w8lift_refs: dict[str, list[str]],
     results_filenames: set[str],
+    shard: tuple[int, int] | None = None,
+    archive: LooseArchive | PackArchive | None = None,
 ) -> list[dict]:
+    archive = archive or LooseArchive(archive_root)
     rows = []
 
-    for path, rel_posix in walk_archive(archive_root):
+    for path, rel_posix in walk_archive(archive_root, archive):
+        if not in_shard(rel_posix, shard):
+            continue
         rel_lower = rel_posix.lower()
         filename = path.name
         category = categorise(path)
-        size = path.stat().st_size
+        size = archive.size(path)
 
         # Subdirectory (first component of path)
         parts = rel_posix.split("/")
@@ -243,29 +256,22 @@ def build_inventory(
 
 
 # ---------------------------------------------------------------------------
-# Main
+# Output
 # ---------------------------------------------------------------------------
 
-def main():
-    print(f"Archive root : {ARCHIVE_ROOT}")
-    print(f"Parsing w8lift.htm for all references...")
-    w8lift_refs = get_w8lift_references(W8LIFT_PATH)
-    print(f"  -> {len(w8lift_refs)} unique resource references found")
-
-    print(f"Loading results_index.csv filenames for cross-reference...")
-    results_filenames = load_results_index_filenames(RESULTS_CSV)
-    print(f"  -> {len(results_filenames)} filenames in results_index.csv")
+ASSETS_FIELDNAMES = [
+    "filename", "rel_path", "subdir", "category",
+    "file_size_bytes", "referenced_from_w8lift", "reference_type",
+    "in_results_index", "notes",
+]
 
-    print(f"Walking LiftTilYaDie/ tree...")
-    rows = build_inventory(ARCHIVE_ROOT, w8lift_refs, results_filenames)
 
-    # Summary
+def print_summary(rows: list[dict]):
     total = len(rows)
     referenced = sum(1 for r in rows if r["referenced_from_w8lift"])
     unreferenced = total - referenced
 
     # Breakdown by category
-    from collections import Counter
     cat_counts = Counter(r["category"] for r in rows)
     ref_by_type = Counter()
     for r in rows:
@@ -295,15 +301,11 @@ def main():
     for sd, count in sorted(subdir_counts.items(), key=lambda x: -x[1]):
         print(f"    {sd:25s} {count}")
 
-    # Write output
+
+def write_output(rows: list[dict]):
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    fieldnames = [
-        "filename", "rel_path", "subdir", "category",
-        "file_size_bytes", "referenced_from_w8lift", "reference_type",
-        "in_results_index", "notes",
-    ]
     with open(OUTPUT_CSV, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer = csv.DictWriter(f, fieldnames=ASSETS_FIELDNAMES)
         writer.writeheader()
         writer.writerows(rows)
 
@@ -320,5 +322,51 @@ def main():
             print(f"  [{r['subdir']:12s}] [{r['category']:10s}] {r['rel_path']}")
 
 
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Inventory every file in the LiftTilYaDie tree.")
+    parser.add_argument("--shard", type=parse_shard, metavar="i/N",
+                        help="inventory only shard i of N (1-based); merge with merge_shards.py")
+    parser.add_argument("--pack", type=Path, nargs="?", const=DEFAULT_PACK, metavar="PACK",
+                        help=f"read from a pack built by pack_archive.py (default {DEFAULT_PACK.name})")
+    args = parser.parse_args()
+
+    print(f"Archive root : {ARCHIVE_ROOT}")
+    archive = open_archive(args.pack)
+    if args.pack:
+        print(f"  -> reading from {archive}")
+
+    if args.shard:
+        # w8lift references and results_index membership span shards;
+        # merge_shards.py fills them in
+        w8lift_refs: dict[str, list[str]] = {}
+        results_filenames: set[str] = set()
+    else:
+        print(f"Parsing w8lift.htm for all references...")
+        w8lift_refs = get_w8lift_references(W8LIFT_PATH, archive)
+        print(f"  -> {len(w8lift_refs)} unique resource references found")
+
+        print(f"Loading results_index.csv filenames for cross-reference...")
+        results_filenames = load_results_index_filenames(RESULTS_CSV)
+        print(f"  -> {len(results_filenames)} filenames in results_index.csv")
+
+    print(f"Walking LiftTilYaDie/ tree...")
+    rows = build_inventory(ARCHIVE_ROOT, w8lift_refs, results_filenames, args.shard, archive)
+    archive.close()
+
+    if args.shard:
+        path = write_shard("assets_index", args.shard, rows)
+        print(f"  -> shard {args.shard[0]}/{args.shard[1]}: {len(rows)} files")
+        print()
+        print(f"Shard output written to: {path}")
+        return
+
+    print_summary(rows)
+    write_output(rows)
+
+
 if __name__ == "__main__":
     main()
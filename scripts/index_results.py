@@ -14,9 +14,15 @@ Outputs: scripts/output/results_index.csv  +  scripts/output/results_index.json
 
 Usage (from repo root):
     python scripts/index_results.py
+    python scripts/index_results.py --shard 2/4   # one shard of a split run;
+                                                  # combine with merge_shards.py
+    python scripts/index_results.py --pack        # read from LiftTilYaDie.pack
+    python scripts/index_results.py --incremental # reuse parses of unchanged files
 """
 
+import argparse
 import csv
+import hashlib
 import json
 import os
 import re
@@ -29,6 +35,11 @@ except ImportError:
     print("ERROR: beautifulsoup4 not installed. Run: pip install beautifulsoup4")
     sys.exit(1)
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from archive_io import DEFAULT_PACK, LooseArchive, PackArchive, open_archive  # noqa: E402
+from sharding import in_shard, parse_shard, write_shard  # noqa: E402
+
 # ---------------------------------------------------------------------------
 # Paths
 # ---------------------------------------------------------------------------
@@ -38,6 +49,7 @@ ARCHIVE_ROOT = REPO_ROOT / "public" / "LiftTilYaDie"
 RESULTS_DIR = ARCHIVE_ROOT / "Results"
 W8LIFT_PATH = ARCHIVE_ROOT / "w8lift.htm"
 OUTPUT_DIR = Path(__file__).parent / "output"
+PARSE_CACHE_PATH = OUTPUT_DIR / "results_index.cache.json"
 
 # ---------------------------------------------------------------------------
 # Files to skip in the root LiftTilYaDie/ directory (non-result pages)
@@ -70,13 +82,43 @@ def normalize_href(href: str) -> str:
     return href.lower()
 
 
-def get_linked_paths(w8lift_path: Path) -> set[str]:
+def split_href(href: str) -> tuple[str, str]:
+    """
+    Like normalize_href, but keep the fragment.
+    e.g. 'Results/13University.htm#TRIALS' -> ('results/13university.htm', 'TRIALS')
+    """
+    path, _, fragment = href.strip().partition("#")
+    return normalize_href(path), fragment.strip()
+
+
+def get_linked_anchors(w8lift_path: Path,
+                       archive: LooseArchive | PackArchive | None = None) -> dict[str, set[str]]:
+    """
+    Parse w8lift.htm and return {normalized relative path: {fragments}}
+    for every link that points into a section of a page.
+    """
+    archive = archive or LooseArchive()
+    soup = BeautifulSoup(archive.read_text(w8lift_path), "html.parser")
+
+    anchors: dict[str, set[str]] = {}
+    for a in soup.find_all("a", href=True):
+        href = a["href"].strip()
+        if href.startswith("http") or href.startswith("mailto") or href.startswith("#"):
+            continue
+        path, fragment = split_href(href)
+        if path and fragment:
+            anchors.setdefault(path, set()).add(fragment)
+
+    return anchors
+
+
+def get_linked_paths(w8lift_path: Path, archive: LooseArchive | PackArchive | None = None) -> set[str]:
     """
     Parse w8lift.htm and return a set of normalized relative paths
     that are linked from it (relative to ARCHIVE_ROOT).
     """
-    with open(w8lift_path, "r", encoding="utf-8", errors="replace") as f:
-        soup = BeautifulSoup(f, "html.parser")
+    archive = archive or LooseArchive()
+    soup = BeautifulSoup(archive.read_text(w8lift_path), "html.parser")
 
     linked = set()
     for a in soup.find_all("a", href=True):
@@ -115,16 +157,17 @@ def is_root_result(filename: str) -> bool:
     return True
 
 
-def collect_files():
+def collect_files(archive: LooseArchive | PackArchive | None = None):
     """
     Returns list of dicts: {path: Path, pool: str, rel_path: str}
     rel_path is relative to ARCHIVE_ROOT, normalized lowercase, for orphan lookup.
     """
+    archive = archive or LooseArchive()
     files = []
 
     # Root pool
-    for f in sorted(ARCHIVE_ROOT.iterdir()):
-        if f.is_file() and is_root_result(f.name):
+    for f in archive.iterdir(ARCHIVE_ROOT):
+        if is_root_result(f.name):
             files.append({
                 "path": f,
                 "pool": "root",
@@ -133,8 +176,8 @@ def collect_files():
 
     # Results pool — all files (htm, pdf, xls)
     extensions = {".htm", ".html", ".pdf", ".xls", ".xlsx"}
-    for f in sorted(RESULTS_DIR.iterdir()):
-        if f.is_file() and f.suffix.lower() in extensions:
+    for f in archive.iterdir(RESULTS_DIR):
+        if f.suffix.lower() in extensions:
             files.append({
                 "path": f,
                 "pool": "Results",
@@ -333,9 +376,39 @@ def extract_source(soup: BeautifulSoup) -> str:
     return ""
 
 
-def extract_notes(path: Path, soup: BeautifulSoup | None, pool: str,
-                  all_result_names: set[str], all_root_names: set[str]) -> list[str]:
-    """Build a list of interesting flags for the notes column."""
+# Placeholder a shard run leaves where the duplicate note goes; the other
+# pool may be on another shard, so merge_shards.py fills it in
+DUPLICATE_SLOT = "<duplicate>"
+
+
+def duplicate_note(filename: str, pool: str,
+                   all_result_names: set[str] | None, all_root_names: set[str] | None) -> str:
+    """
+    Note for a file that also exists in the other pool, else ''. With the
+    name sets unknown (None, shard runs), DUPLICATE_SLOT.
+    """
+    if all_result_names is None or all_root_names is None:
+        return DUPLICATE_SLOT
+    if pool == "Results" and filename.lower() in all_root_names:
+        return "duplicate_exists_in_root"
+    if pool == "root" and filename.lower() in all_result_names:
+        return "duplicate_exists_in_Results"
+    return ""
+
+
+def fill_duplicate_slot(notes: str, note: str) -> str:
+    """Replace DUPLICATE_SLOT in a joined notes string with note (or drop it)."""
+    parts = [note if n == DUPLICATE_SLOT else n for n in notes.split("; ")]
+    return "; ".join(n for n in parts if n)
+
+
+def extract_notes(path: Path, parsed: dict | None, pool: str,
+                  all_result_names: set[str] | None, all_root_names: set[str] | None,
+                  size: int) -> list[str]:
+    """
+    Build a list of interesting flags for the notes column.
+    parsed is the parse_html() result, or None for non-HTML files.
+    """
     notes = []
     filename = path.name
     stem = path.stem.lower()
@@ -353,12 +426,11 @@ def extract_notes(path: Path, soup: BeautifulSoup | None, pool: str,
         notes.append("pdf_viewer_stub")
         return notes
 
-    if soup is None:
+    if parsed is None:
         notes.append("parse_error")
         return notes
 
     # File size check
-    size = path.stat().st_size
     if size < 1000:
         notes.append(f"stub_file_{size}b")
 
@@ -367,16 +439,12 @@ def extract_notes(path: Path, soup: BeautifulSoup | None, pool: str,
         notes.append("possible_draft_or_temp")
 
     # Duplicate: if Results/ file also exists as root file (or vice versa)
-    if pool == "Results":
-        if filename.lower() in all_root_names:
-            notes.append("duplicate_exists_in_root")
-    elif pool == "root":
-        if filename.lower() in all_result_names:
-            notes.append("duplicate_exists_in_Results")
+    dup = duplicate_note(filename, pool, all_result_names, all_root_names)
+    if dup:
+        notes.append(dup)
 
     # Has record notations
-    body_text = extract_text_for_body(soup, 5000)
-    if "RECORD" in body_text:
+    if parsed["has_record_notations"]:
         notes.append("has_record_notations")
 
     # Multiple meets in one file (heuristic: body > 150kb and has multiple dates)
@@ -392,8 +460,52 @@ def extract_notes(path: Path, soup: BeautifulSoup | None, pool: str,
 # Step 4 — Process each file
 # ---------------------------------------------------------------------------
 
+def parse_html(html: str, filename: str) -> dict:
+    """Everything process_file() takes from the page content itself."""
+    soup = BeautifulSoup(html, "html.parser")
+    date_raw, date_start, date_end, location = extract_date_and_location(soup, filename)
+    return {
+        "meet_name": extract_meet_name(soup),
+        "date_raw": date_raw,
+        "date_start": date_start,
+        "date_end": date_end,
+        "location": location,
+        "source": extract_source(soup),
+        "has_record_notations": "RECORD" in extract_text_for_body(soup, 5000),
+    }
+
+
+def parser_fingerprint() -> str:
+    """Hash of this file, so cached parses are dropped when extraction changes."""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def load_parse_cache(cache_path: Path = PARSE_CACHE_PATH) -> dict[str, dict]:
+    """{'<sha256>:<filename>': parse_html() result} from the last --incremental run."""
+    if not cache_path.exists():
+        return {}
+    with open(cache_path, encoding="utf-8") as f:
+        cache = json.load(f)
+    if cache.get("parser") != parser_fingerprint():
+        return {}
+    return cache["entries"]
+
+
+def write_parse_cache(entries: dict[str, dict], cache_path: Path = PARSE_CACHE_PATH):
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, "w", encoding="utf-8") as f:
+        json.dump({"parser": parser_fingerprint(), "entries": entries}, f)
+
+
 def process_file(entry: dict, linked_paths: set[str],
-                 all_result_names: set[str], all_root_names: set[str]) -> dict:
+                 all_result_names: set[str] | None, all_root_names: set[str] | None,
+                 archive: LooseArchive | PackArchive | None = None,
+                 parse_cache: dict[str, dict] | None = None) -> dict:
+    """
+    Index one file. With parse_cache, pages whose content hash is already
+    cached skip the BeautifulSoup parse; new parses are added to it.
+    """
+    archive = archive or LooseArchive()
     path: Path = entry["path"]
     pool: str = entry["pool"]
     rel_path: str = entry["rel_path"]   # already normalized lowercase
@@ -402,7 +514,7 @@ def process_file(entry: dict, linked_paths: set[str],
 
     linked_from_root = rel_path in linked_paths
 
-    size = path.stat().st_size
+    size = archive.size(path)
 
     # Default record
     record = {
@@ -422,7 +534,7 @@ def process_file(entry: dict, linked_paths: set[str],
 
     # Non-HTML files
     if suffix in (".pdf", ".xls", ".xlsx"):
-        notes = extract_notes(path, None, pool, all_result_names, all_root_names)
+        notes = extract_notes(path, None, pool, all_result_names, all_root_names, size)
         # Try to infer year from filename for non-HTML
         y = year_from_filename(filename)
         if y:
@@ -433,85 +545,55 @@ def process_file(entry: dict, linked_paths: set[str],
 
     # HTML files
     try:
-        with open(path, "r", encoding="utf-8", errors="replace") as f:
-            html = f.read()
-        soup = BeautifulSoup(html, "html.parser")
+        key = f"{archive.sha256(path)}:{filename}" if parse_cache is not None else ""
+        if key in (parse_cache or {}):
+            parsed = parse_cache[key]
+        else:
+            parsed = parse_html(archive.read_text(path), filename)
+            if parse_cache is not None:
+                parse_cache[key] = parsed
     except Exception as e:
         record["notes"] = f"parse_error: {e}"
         return record
 
-    record["meet_name"] = extract_meet_name(soup)
+    for field in ("meet_name", "date_raw", "date_start", "date_end", "location", "source"):
+        record[field] = parsed[field]
 
-    date_raw, date_start, date_end, location = extract_date_and_location(soup, filename)
-    record["date_raw"] = date_raw
-    record["date_start"] = date_start
-    record["date_end"] = date_end
-    record["location"] = location
-
-    record["source"] = extract_source(soup)
-
-    notes = extract_notes(path, soup, pool, all_result_names, all_root_names)
+    notes = extract_notes(path, parsed, pool, all_result_names, all_root_names, size)
     record["notes"] = "; ".join(notes)
 
     return record
 
 
 # ---------------------------------------------------------------------------
-# Main
+# Output
 # ---------------------------------------------------------------------------
 
-def main():
-    print(f"Archive root: {ARCHIVE_ROOT}")
-    print(f"Reading w8lift.htm...")
-
-    linked_paths = get_linked_paths(W8LIFT_PATH)
-    print(f"  -> {len(linked_paths)} linked hrefs found in w8lift.htm")
-
-    print("Collecting files...")
-    files = collect_files()
-
-    # Build lookup sets for duplicate detection
-    all_result_names = {
-        Path(e["path"].name).name.lower()
-        for e in files if e["pool"] == "Results"
-    }
-    all_root_names = {
-        Path(e["path"].name).name.lower()
-        for e in files if e["pool"] == "root"
-    }
-
-    print(f"  -> {len(files)} files to index "
-          f"({sum(1 for e in files if e['pool'] == 'root')} root, "
-          f"{sum(1 for e in files if e['pool'] == 'Results')} Results)")
+RESULTS_FIELDNAMES = [
+    "filename", "pool", "file_path", "linked_from_root",
+    "meet_name", "date_raw", "date_start", "date_end",
+    "location", "source", "file_size_bytes", "notes",
+]
 
-    results = []
-    for i, entry in enumerate(files):
-        if (i + 1) % 50 == 0:
-            print(f"  Processing file {i+1}/{len(files)}...")
-        rec = process_file(entry, linked_paths, all_result_names, all_root_names)
-        results.append(rec)
 
-    # Write output
+def write_outputs(results: list[dict]) -> tuple[Path, Path]:
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
     csv_path = OUTPUT_DIR / "results_index.csv"
     json_path = OUTPUT_DIR / "results_index.json"
 
-    fieldnames = [
-        "filename", "pool", "file_path", "linked_from_root",
-        "meet_name", "date_raw", "date_start", "date_end",
-        "location", "source", "file_size_bytes", "notes",
-    ]
-
     with open(csv_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer = csv.DictWriter(f, fieldnames=RESULTS_FIELDNAMES)
         writer.writeheader()
         writer.writerows(results)
 
     with open(json_path, "w", encoding="utf-8") as f:
         json.dump(results, f, indent=2)
 
-    # Summary
+    return csv_path, json_path
+
+
+def print_summary(results: list[dict], csv_path: Path, json_path: Path):
     total = len(results)
     linked_count = sum(1 for r in results if r["linked_from_root"])
     orphans = total - linked_count
@@ -540,5 +622,89 @@ def main():
     print(f"  {json_path}")
 
 
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Index the LiftTilYaDie results archive.")
+    parser.add_argument("--shard", type=parse_shard, metavar="i/N",
+                        help="index only shard i of N (1-based); merge with merge_shards.py")
+    parser.add_argument("--pack", type=Path, nargs="?", const=DEFAULT_PACK, metavar="PACK",
+                        help=f"read from a pack built by pack_archive.py (default {DEFAULT_PACK.name})")
+    parser.add_argument("--incremental", action="store_true",
+                        help="reuse cached parses of pages whose content hash is unchanged")
+    args = parser.parse_args()
+
+    print(f"Archive root: {ARCHIVE_ROOT}")
+    archive = open_archive(args.pack)
+    if args.pack:
+        print(f"  -> reading from {archive}")
+    parse_cache = load_parse_cache() if args.incremental else None
+    cached_before = len(parse_cache or {})
+
+    # Cross-shard facts (w8lift links, root/Results duplicates) are
+    # resolved by merge_shards.py once every shard is in
+    linked_paths: set[str] = set()
+    all_result_names: set[str] | None = None
+    all_root_names: set[str] | None = None
+
+    if not args.shard:
+        print(f"Reading w8lift.htm...")
+        linked_paths = get_linked_paths(W8LIFT_PATH, archive)
+        print(f"  -> {len(linked_paths)} linked hrefs found in w8lift.htm")
+
+    print("Collecting files...")
+    files = collect_files(archive)
+
+    if args.shard:
+        files = [e for e in files if in_shard(e["rel_path"], args.shard)]
+        print(f"  -> shard {args.shard[0]}/{args.shard[1]}")
+    else:
+        # Build lookup sets for duplicate detection
+        all_result_names = {
+            Path(e["path"].name).name.lower()
+            for e in files if e["pool"] == "Results"
+        }
+        all_root_names = {
+            Path(e["path"].name).name.lower()
+            for e in files if e["pool"] == "root"
+        }
+
+    print(f"  -> {len(files)} files to index "
+          f"({sum(1 for e in files if e['pool'] == 'root')} root, "
+          f"{sum(1 for e in files if e['pool'] == 'Results')} Results)")
+
+    results = []
+    for i, entry in enumerate(files):
+        if (i + 1) % 50 == 0:
+            print(f"  Processing file {i+1}/{len(files)}...")
+        rec = process_file(entry, linked_paths, all_result_names, all_root_names,
+                           archive, parse_cache)
+        results.append(rec)
+
+    if parse_cache is not None:
+        parsed_now = len(parse_cache) - cached_before
+        pages = [e["path"] for e in files if e["path"].suffix.lower() in (".htm", ".html")]
+        if args.shard:
+            # files is one shard; the rest of the cache belongs to the others
+            write_parse_cache(parse_cache)
+        else:
+            # Drop entries for content that is no longer in the tree
+            live = {f"{archive.sha256(p)}:{p.name}" for p in pages}
+            write_parse_cache({k: v for k, v in parse_cache.items() if k in live})
+        print(f"  -> parse cache: {len(pages) - parsed_now} pages reused, {parsed_now} parsed")
+    archive.close()
+
+    if args.shard:
+        path = write_shard("results_index", args.shard, results)
+        print()
+        print(f"Shard output written to: {path}")
+        return
+
+    csv_path, json_path = write_outputs(results)
+    print_summary(results, csv_path, json_path)
+
+
 if __name__ == "__main__":
     main()
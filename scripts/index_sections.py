@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+index_sections.py — LiftTilYaDie Meet Section Indexer
+
+Some result pages hold more than one meet (e.g. Results/13University.htm
+carries the PAC-World Team Trials under #TRIALS, and the big American Open
+pages carry two captioned result tables). This stage splits every HTML
+result page into sections and records, for each one:
+
+  - anchor name (<a name="...">) if the section has one
+  - meet name / caption, date and location of that section
+  - start/end BYTE offsets into the file, so a reader can seek straight to
+    one meet and parse only that slice
+  - whether w8lift.htm links to that anchor
+
+A section starts at an <a name> anchor or a <caption>; the first section
+always starts at byte 0 so the page <head> stays with it. Single-meet pages
+produce one section covering the whole file.
+
+Output: scripts/output/sections_index.csv  +  scripts/output/sections_index.json
+
+Usage (from repo root):
+    python scripts/index_sections.py
+    python scripts/index_sections.py --pack        # read from LiftTilYaDie.pack
+    python scripts/index_sections.py --read Results/13University.htm#TRIALS
+"""
+
+import argparse
+import csv
+import json
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from archive_io import DEFAULT_PACK, LooseArchive, PackArchive, open_archive  # noqa: E402
+from index_results import (  # noqa: E402
+    ARCHIVE_ROOT,
+    OUTPUT_DIR,
+    REPO_ROOT,
+    W8LIFT_PATH,
+    BeautifulSoup,
+    collect_files,
+    extract_caption_lines,
+    extract_date_and_location,
+    get_linked_anchors,
+    split_href,
+)
+
+# ---------------------------------------------------------------------------
+# Paths
+# ---------------------------------------------------------------------------
+
+SECTIONS_CSV = OUTPUT_DIR / "sections_index.csv"
+SECTIONS_JSON = OUTPUT_DIR / "sections_index.json"
+
+SECTION_FIELDNAMES = [
+    "filename", "file_path", "section", "anchor", "linked_from_root",
+    "meet_name", "date_raw", "date_start", "date_end", "location",
+    "byte_start", "byte_end",
+]
+
+# ---------------------------------------------------------------------------
+# Step 1 — Find section boundaries (byte offsets)
+# ---------------------------------------------------------------------------
+
+ANCHOR_RE = re.compile(rb"<a\s+name\s*=\s*[\"']?([^\"'\s>]+)", re.IGNORECASE)
+CAPTION_RE = re.compile(rb"<caption\b", re.IGNORECASE)
+TABLE_RE = re.compile(rb"<table\b", re.IGNORECASE)
+ROW_RE = re.compile(rb"<tr\b", re.IGNORECASE)
+
+# A caption's section starts at its <table> if that opened just before it
+TABLE_LOOKBEHIND = 200
+# An anchor right before a caption (or vice versa) marks one section, not two
+MERGE_WINDOW = 400
+# Fewer rows than this before the first boundary = still the page heading
+LEADING_ROWS = 3
+# Section metadata (caption, date, location) sits at the top of a section
+SECTION_HEAD_BYTES = 8192
+
+
+def find_boundaries(data: bytes) -> list[tuple[int, str]]:
+    """Return sorted (byte_offset, anchor_name) section starts; name may be ''."""
+    found = []
+    for m in ANCHOR_RE.finditer(data):
+        found.append((m.start(), m.group(1).decode("ascii", errors="replace")))
+    for m in CAPTION_RE.finditer(data):
+        start = m.start()
+        window_start = max(0, start - TABLE_LOOKBEHIND)
+        tables = list(TABLE_RE.finditer(data, window_start, start))
+        if tables:
+            start = tables[-1].start()
+        found.append((start, ""))
+    found.sort()
+
+    merged: list[tuple[int, str]] = []
+    for offset, name in found:
+        if merged and offset - merged[-1][0] < MERGE_WINDOW:
+            prev_offset, prev_name = merged[-1]
+            merged[-1] = (prev_offset, prev_name or name)
+            continue
+        merged.append((offset, name))
+    return merged
+
+
+def split_sections(data: bytes) -> list[tuple[int, int, str]]:
+    """Return (byte_start, byte_end, anchor) for each section of a page."""
+    boundaries = find_boundaries(data)
+    # A boundary before any real table rows is the page's own caption: it
+    # opens section 1 rather than splitting off the <head>
+    if boundaries and len(ROW_RE.findall(data, 0, boundaries[0][0])) < LEADING_ROWS:
+        first_anchor = boundaries[0][1]
+        boundaries = boundaries[1:]
+    else:
+        first_anchor = ""
+    starts = [0] + [offset for offset, _ in boundaries]
+    ends = starts[1:] + [len(data)]
+    names = [first_anchor] + [name for _, name in boundaries]
+    return list(zip(starts, ends, names))
+
+
+# ---------------------------------------------------------------------------
+# Step 2 — Per-section metadata
+# ---------------------------------------------------------------------------
+
+HEADING_RE = re.compile(r"<font[^>]*size\s*=\s*[\"']?[67]", re.IGNORECASE)
+MEET_NAME_CHARS = 120
+
+
+def section_meet_name(soup: BeautifulSoup, is_first: bool) -> str:
+    """Caption / title / anchor heading of one section."""
+    if is_first:
+        title = soup.find("title")
+        if title and title.string and title.string.strip():
+            return title.string.strip()
+    lines = extract_caption_lines(soup)
+    if lines:
+        return lines[0]
+    heading = soup.find(lambda tag: tag.name == "font" and HEADING_RE.match(str(tag)))
+    if heading:
+        return heading.get_text(" ", strip=True)
+    # Legacy anchors are often left unclosed and swallow the whole table
+    anchor = soup.find("a", attrs={"name": True})
+    if anchor:
+        return anchor.get_text(" ", strip=True)[:MEET_NAME_CHARS]
+    return ""
+
+
+def read_section(path: Path, byte_start: int, byte_end: int,
+                 archive: LooseArchive | PackArchive | None = None) -> str:
+    """Read one section of a page without loading the rest of the file."""
+    archive = archive or LooseArchive()
+    return archive.read_range(path, byte_start, byte_end).decode("utf-8", errors="replace")
+
+
+def index_file(path: Path, linked_anchors: dict[str, set[str]], rel_path: str,
+               archive: LooseArchive | PackArchive | None = None) -> list[dict]:
+    archive = archive or LooseArchive()
+    data = archive.read_bytes(path)
+
+    file_path = str(path.relative_to(REPO_ROOT)).replace("\\", "/")
+    linked = linked_anchors.get(rel_path, set())
+    rows = []
+    for i, (start, end, anchor) in enumerate(split_sections(data), 1):
+        html = data[start:min(end, start + SECTION_HEAD_BYTES)].decode("utf-8", errors="replace")
+        soup = BeautifulSoup(html, "html.parser")
+        date_raw, date_start, date_end, location = extract_date_and_location(soup, path.name)
+        rows.append({
+            "filename": path.name,
+            "file_path": file_path,
+            "section": i,
+            "anchor": anchor,
+            "linked_from_root": bool(anchor) and anchor in linked,
+            "meet_name": section_meet_name(soup, i == 1),
+            "date_raw": date_raw,
+            "date_start": date_start,
+            "date_end": date_end,
+            "location": location,
+            "byte_start": start,
+            "byte_end": end,
+        })
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# Lookup — resolve 'Results/13University.htm#TRIALS' to a slice
+# ---------------------------------------------------------------------------
+
+def load_sections(json_path: Path = SECTIONS_JSON) -> dict[tuple[str, str], dict]:
+    """Map (normalized rel path, anchor) -> section row; '' anchor = section 1."""
+    with open(json_path, encoding="utf-8") as f:
+        rows = json.load(f)
+    lookup = {}
+    for r in rows:
+        rel = Path(r["file_path"]).relative_to(ARCHIVE_ROOT.relative_to(REPO_ROOT)).as_posix().lower()
+        if r["anchor"]:
+            lookup[(rel, r["anchor"])] = r
+        if r["section"] == 1:
+            lookup[(rel, "")] = r
+    return lookup
+
+
+def resolve_href(href: str, lookup: dict[tuple[str, str], dict]) -> dict | None:
+    path, fragment = split_href(href)
+    return lookup.get((path, fragment)) or lookup.get((path, fragment.upper()))
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Index meet sections inside result pages.")
+    parser.add_argument("--read", metavar="HREF",
+                        help="print one section, e.g. Results/13University.htm#TRIALS")
+    parser.add_argument("--pack", type=Path, nargs="?", const=DEFAULT_PACK, metavar="PACK",
+                        help=f"read from a pack built by pack_archive.py (default {DEFAULT_PACK.name})")
+    args = parser.parse_args()
+
+    archive = open_archive(args.pack)
+    if args.read:
+        section = resolve_href(args.read, load_sections())
+        if section is None:
+            print(f"ERROR: no section for {args.read}")
+            sys.exit(1)
+        print(read_section(REPO_ROOT / section["file_path"],
+                           section["byte_start"], section["byte_end"], archive))
+        archive.close()
+        return
+
+    print(f"Archive root: {ARCHIVE_ROOT}")
+    if args.pack:
+        print(f"  -> reading from {archive}")
+    print(f"Reading w8lift.htm anchor links...")
+    linked_anchors = get_linked_anchors(W8LIFT_PATH, archive)
+    print(f"  -> {sum(len(v) for v in linked_anchors.values())} anchor links found in w8lift.htm")
+
+    files = [e for e in collect_files(archive) if e["path"].suffix.lower() in (".htm", ".html")]
+    print(f"  -> {len(files)} HTML result pages")
+
+    rows = []
+    for i, entry in enumerate(files):
+        if (i + 1) % 50 == 0:
+            print(f"  Processing file {i+1}/{len(files)}...")
+        rows.extend(index_file(entry["path"], linked_anchors, entry["rel_path"], archive))
+    archive.close()
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    with open(SECTIONS_CSV, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=SECTION_FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(rows)
+    with open(SECTIONS_JSON, "w", encoding="utf-8") as f:
+        json.dump(rows, f, indent=2)
+
+    multi = {}
+    for r in rows:
+        multi[r["file_path"]] = max(multi.get(r["file_path"], 0), r["section"])
+    multi = {k: v for k, v in multi.items() if v > 1}
+
+    print()
+    print("=" * 50)
+    print("SUMMARY")
+    print(f"  Pages indexed       : {len(files)}")
+    print(f"  Sections            : {len(rows)}")
+    print(f"  Multi-section pages : {len(multi)}")
+    print(f"  Linked anchors      : {sum(1 for r in rows if r['linked_from_root'])}")
+    print()
+    print("MULTI-SECTION PAGES:")
+    for r in rows:
+        if r["file_path"] in multi:
+            anchor = f"#{r['anchor']}" if r["anchor"] else ""
+            print(f"  {r['filename']}{anchor:10s} [{r['byte_start']:>7}-{r['byte_end']:>7}] "
+                  f"{r['meet_name'][:40]} {r['date_start']}")
+
+    print()
+    print(f"Output written to:")
+    print(f"  {SECTIONS_CSV}")
+    print(f"  {SECTIONS_JSON}")
+
+
+if __name__ == "__main__":
+    main()
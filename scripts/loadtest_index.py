@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+loadtest_index.py — latency check for serve_index.py
+
+Fires a mix of /meets, /assets and /assets/<path> queries at a running
+serve_index.py from several keep-alive connections and reports latency
+percentiles. Query values are taken from the local index files so every
+request hits real data. Standard library only.
+
+Usage (from repo root):
+    python scripts/serve_index.py --quiet &
+    python scripts/loadtest_index.py
+    python scripts/loadtest_index.py --requests 20000 --concurrency 16 --gzip
+    python scripts/loadtest_index.py --revalidate   # send If-None-Match
+"""
+
+import argparse
+import csv
+import http.client
+import json
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import quote, urlencode
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from serve_index import ASSETS_CSV, DEFAULT_HOST, DEFAULT_PORT, RESULTS_JSON  # noqa: E402
+
+# ---------------------------------------------------------------------------
+# Step 1 — Build a query mix from the index files
+# ---------------------------------------------------------------------------
+
+def build_urls(seed: int) -> list[str]:
+    with open(RESULTS_JSON, encoding="utf-8") as f:
+        meets = json.load(f)
+    assets = []
+    if ASSETS_CSV.exists():
+        with open(ASSETS_CSV, newline="", encoding="utf-8") as f:
+            assets = list(csv.DictReader(f))
+
+    years = sorted({m["date_start"][:4] for m in meets if m["date_start"]})
+    cities = sorted({m["location"].split(",")[0].split()[-1] for m in meets if "," in m["location"]})
+    sources = sorted({m["source"] for m in meets if m["source"]})
+
+    rng = random.Random(seed)
+    urls = ["/health", "/meets", "/meets?orphan=true", "/assets?referenced=false"]
+    for y in years:
+        urls.append("/meets?" + urlencode({"year": y}))
+        urls.append("/meets?" + urlencode({"year": y, "orphan": rng.choice(["true", "false"])}))
+    for c in cities:
+        urls.append("/meets?" + urlencode({"location": c}))
+    for s in sources:
+        urls.append("/meets?" + urlencode({"source": s}))
+    for cat in sorted({a["category"] for a in assets}):
+        urls.append("/assets?" + urlencode({"category": cat, "limit": 50}))
+    for a in rng.sample(assets, min(200, len(assets))):
+        urls.append("/assets/" + quote(a["rel_path"]))
+    return urls
+
+
+# ---------------------------------------------------------------------------
+# Step 2 — Run
+# ---------------------------------------------------------------------------
+
+def worker(host: str, port: int, urls: list[str], use_gzip: bool, revalidate: bool):
+    """Run urls over one keep-alive connection; return (latencies_ms, status counts)."""
+    conn = http.client.HTTPConnection(host, port, timeout=10)
+    etags: dict[str, str] = {}
+    latencies, statuses = [], Counter()
+    for url in urls:
+        headers = {"Accept-Encoding": "gzip"} if use_gzip else {}
+        if revalidate and url in etags:
+            headers["If-None-Match"] = etags[url]
+        start = time.perf_counter()
+        conn.request("GET", url, headers=headers)
+        resp = conn.getresponse()
+        resp.read()
+        latencies.append((time.perf_counter() - start) * 1000)
+        statuses[resp.status] += 1
+        if resp.getheader("ETag"):
+            etags[url] = resp.getheader("ETag")
+    conn.close()
+    return latencies, statuses
+
+
+def percentile(sorted_ms: list[float], p: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_ms:
+        return float("nan")
+    k = max(0, min(len(sorted_ms) - 1, round(p / 100 * len(sorted_ms) + 0.5) - 1))
+    return sorted_ms[k]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test serve_index.py.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--gzip", action="store_true", help="send Accept-Encoding: gzip")
+    parser.add_argument("--revalidate", action="store_true", help="repeat requests with If-None-Match")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    urls = build_urls(args.seed)
+    rng = random.Random(args.seed)
+    plan = [rng.choice(urls) for _ in range(args.requests)]
+    chunks = [plan[i::args.concurrency] for i in range(args.concurrency)]
+    print(f"Target      : http://{args.host}:{args.port}")
+    print(f"Query mix   : {len(urls)} distinct URLs, {args.requests} requests, "
+          f"{args.concurrency} connections")
+
+    start = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            outcomes = list(pool.map(
+                lambda chunk: worker(args.host, args.port, chunk, args.gzip, args.revalidate), chunks
+            ))
+    except ConnectionRefusedError:
+        print(f"ERROR: nothing listening on {args.host}:{args.port}. Run: python scripts/serve_index.py")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(ms for lat, _ in outcomes for ms in lat)
+    statuses = sum((s for _, s in outcomes), Counter())
+
+    print()
+    print("=" * 50)
+    print("SUMMARY")
+    print(f"  Requests    : {len(latencies)} in {elapsed:.2f} s ({len(latencies) / elapsed:,.0f} req/s)")
+    print(f"  Status      : " + ", ".join(f"{k}={v}" for k, v in sorted(statuses.items())))
+    print(f"  p50         : {percentile(latencies, 50):.2f} ms")
+    print(f"  p90         : {percentile(latencies, 90):.2f} ms")
+    print(f"  p99         : {percentile(latencies, 99):.2f} ms")
+    print(f"  max         : {latencies[-1]:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
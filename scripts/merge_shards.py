@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+merge_shards.py — combine sharded indexer runs
+
+Merges the per-shard outputs written by
+
+    python scripts/index_results.py --shard i/N
+    python scripts/index_assets.py  --shard i/N
+
+into the usual results_index.csv/.json and assets_index.csv, with the same
+row order and summary a single-node run produces. Facts that span shards
+are resolved here rather than on the shard machines:
+
+  results_index : linked_from_root, duplicate_exists_in_root/Results notes
+  assets_index  : referenced_from_w8lift, reference_type, in_results_index
+
+Usage (from repo root):
+    python scripts/merge_shards.py              # results, then assets
+    python scripts/merge_shards.py results
+    python scripts/merge_shards.py assets
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import index_assets  # noqa: E402
+import index_results  # noqa: E402
+from sharding import SHARDS_DIR, load_shards  # noqa: E402
+
+POOL_ORDER = {"root": 0, "Results": 1}
+
+
+# ---------------------------------------------------------------------------
+# Results
+# ---------------------------------------------------------------------------
+
+def results_rel_path(record: dict) -> str:
+    """The rel_path collect_files() gives this record, for w8lift lookup."""
+    name = record["filename"].lower()
+    return name if record["pool"] == "root" else f"results/{name}"
+
+
+def merge_results() -> list[dict]:
+    shards = load_shards("results_index")
+    results = [r for s in shards for r in s["records"]]
+    print(f"  -> {len(shards)} results shards, {len(results)} records")
+
+    # Same order as collect_files(): root pool, then Results, each sorted by path
+    results.sort(key=lambda r: (POOL_ORDER[r["pool"]], Path(r["file_path"])))
+
+    print(f"Reading w8lift.htm...")
+    linked_paths = index_results.get_linked_paths(index_results.W8LIFT_PATH)
+    print(f"  -> {len(linked_paths)} linked hrefs found in w8lift.htm")
+
+    all_result_names = {r["filename"].lower() for r in results if r["pool"] == "Results"}
+    all_root_names = {r["filename"].lower() for r in results if r["pool"] == "root"}
+
+    for r in results:
+        r["linked_from_root"] = results_rel_path(r) in linked_paths
+        dup = index_results.duplicate_note(
+            r["filename"], r["pool"], all_result_names, all_root_names
+        )
+        r["notes"] = index_results.fill_duplicate_slot(r["notes"], dup)
+
+    csv_path, json_path = index_results.write_outputs(results)
+    index_results.print_summary(results, csv_path, json_path)
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Assets
+# ---------------------------------------------------------------------------
+
+def merge_assets(results: list[dict] | None) -> list[dict]:
+    shards = load_shards("assets_index")
+    rows = [r for s in shards for r in s["records"]]
+    print(f"  -> {len(shards)} assets shards, {len(rows)} files")
+
+    # Same order as walk_archive()
+    rows.sort(key=lambda r: Path(r["rel_path"]))
+
+    print(f"Parsing w8lift.htm for all references...")
+    w8lift_refs = index_assets.get_w8lift_references(index_assets.W8LIFT_PATH)
+    print(f"  -> {len(w8lift_refs)} unique resource references found")
+
+    if results is not None:
+        results_filenames = {r["filename"].lower() for r in results}
+    else:
+        results_filenames = index_assets.load_results_index_filenames(index_assets.RESULTS_CSV)
+    print(f"  -> {len(results_filenames)} filenames in results_index")
+
+    for r in rows:
+        ref_types = w8lift_refs.get(r["rel_path"].lower(), [])
+        r["referenced_from_w8lift"] = bool(ref_types)
+        r["reference_type"] = "; ".join(ref_types)
+        r["in_results_index"] = r["filename"].lower() in results_filenames
+        if r["in_results_index"]:
+            r["notes"] = "; ".join(["in_results_index"] + [n for n in r["notes"].split("; ") if n])
+
+    index_assets.print_summary(rows)
+    index_assets.write_output(rows)
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge sharded indexer outputs.")
+    parser.add_argument("kind", nargs="?", choices=("results", "assets", "all"), default="all")
+    args = parser.parse_args()
+
+    print(f"Shard directory: {SHARDS_DIR}")
+    try:
+        results = None
+        if args.kind in ("results", "all"):
+            print("Merging results_index shards...")
+            results = merge_results()
+            print()
+        if args.kind in ("assets", "all"):
+            print("Merging assets_index shards...")
+            merge_assets(results)
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+pack_archive.py — build a seekable pack of the LiftTilYaDie tree
+
+Writes every file under public/LiftTilYaDie/ into one .pack container
+(format in archive_io.py): one compressed frame per member plus a central
+index of path, offset, length, size, codec, sha256 and mtime. The indexers
+read it with --pack instead of opening and statting ~800 loose files.
+
+Rebuilding over an existing pack is incremental: a member whose sha256
+matches the old index has its compressed frame copied across unchanged,
+so only new or edited files are recompressed.
+
+Output: scripts/output/LiftTilYaDie.pack
+
+Usage (from repo root):
+    python scripts/pack_archive.py
+    python scripts/pack_archive.py --out /tmp/archive.pack
+    python scripts/pack_archive.py --verify      # re-hash every member
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import zlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from archive_io import (  # noqa: E402
+    ARCHIVE_ROOT,
+    DEFAULT_PACK,
+    FOOTER,
+    PACK_MAGIC,
+    PACK_VERSION,
+    LooseArchive,
+    PackArchive,
+    compress,
+    default_codec,
+    read_pack_index,
+    sha256_hex,
+)
+
+# ---------------------------------------------------------------------------
+# Step 1 — Load the previous index (if any) for reuse
+# ---------------------------------------------------------------------------
+
+def load_previous(pack_path: Path) -> tuple[dict[str, dict], bytes | None]:
+    """Return ({path: index entry}, pack bytes) of an existing pack, or ({}, None)."""
+    if not pack_path.exists():
+        return {}, None
+    try:
+        index = read_pack_index(pack_path)
+    except ValueError as e:
+        print(f"  -> ignoring existing pack: {e}")
+        return {}, None
+    return {m["path"]: m for m in index["members"]}, pack_path.read_bytes()
+
+
+# ---------------------------------------------------------------------------
+# Step 2 — Write the pack
+# ---------------------------------------------------------------------------
+
+def build_pack(pack_path: Path, codec: str) -> dict:
+    previous, old_data = load_previous(pack_path)
+    loose = LooseArchive(ARCHIVE_ROOT)
+
+    members = []
+    stats = {"members": 0, "reused": 0, "compressed": 0, "raw": 0,
+             "bytes_in": 0, "removed": 0}
+    tmp_path = pack_path.with_suffix(pack_path.suffix + ".tmp")
+    pack_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(tmp_path, "wb") as out:
+        out.write(PACK_MAGIC)
+        for i, (path, rel) in enumerate(loose.walk()):
+            if (i + 1) % 100 == 0:
+                print(f"  Packing file {i+1}...")
+            data = path.read_bytes()
+            digest = sha256_hex(data)
+            old = previous.get(rel)
+
+            # Unchanged content: copy the old frame, skip recompression
+            if old is not None and old["sha256"] == digest and old["codec"] in (codec, "raw"):
+                frame = old_data[old["offset"]:old["offset"] + old["length"]]
+                member_codec = old["codec"]
+                stats["reused"] += 1
+            else:
+                frame, member_codec = compress(data, codec)
+                stats["compressed"] += 1
+
+            if member_codec == "raw":
+                stats["raw"] += 1
+            members.append({
+                "path": rel,
+                "offset": out.tell(),
+                "length": len(frame),
+                "size": len(data),
+                "codec": member_codec,
+                "sha256": digest,
+                "mtime": path.stat().st_mtime,
+            })
+            out.write(frame)
+            stats["members"] += 1
+            stats["bytes_in"] += len(data)
+
+        index_offset = out.tell()
+        index = zlib.compress(json.dumps({
+            "version": PACK_VERSION,
+            "codec": codec,
+            "members": members,
+        }).encode("utf-8"), 9)
+        out.write(index)
+        out.write(FOOTER.pack(index_offset, len(index), PACK_MAGIC))
+
+    os.replace(tmp_path, pack_path)
+    stats["removed"] = len(set(previous) - {m["path"] for m in members})
+    stats["bytes_out"] = pack_path.stat().st_size
+    return stats
+
+
+def verify_pack(pack_path: Path) -> list[str]:
+    """Decompress every member and return paths whose sha256 doesn't match."""
+    pack = PackArchive(pack_path)
+    bad = []
+    try:
+        for path, rel in pack.walk():
+            if sha256_hex(pack.read_bytes(path)) != pack.sha256(path):
+                bad.append(rel)
+    finally:
+        pack.close()
+    return bad
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack the LiftTilYaDie tree into one seekable file.")
+    parser.add_argument("--out", type=Path, default=DEFAULT_PACK, help=f"pack path (default {DEFAULT_PACK.name})")
+    parser.add_argument("--verify", action="store_true", help="check every member hash of an existing pack")
+    args = parser.parse_args()
+
+    if args.verify:
+        print(f"Verifying {args.out}...")
+        bad = verify_pack(args.out)
+        if bad:
+            print(f"ERROR: {len(bad)} members failed their hash check:")
+            for rel in bad:
+                print(f"  {rel}")
+            sys.exit(1)
+        print("  -> all members OK")
+        return
+
+    codec = default_codec()
+    print(f"Archive root: {ARCHIVE_ROOT}")
+    print(f"Codec       : {codec}" + ("" if codec == "zstd" else "  (pip install zstandard for zstd)"))
+
+    start = time.perf_counter()
+    stats = build_pack(args.out, codec)
+    elapsed = time.perf_counter() - start
+
+    print()
+    print("=" * 50)
+    print("SUMMARY")
+    print(f"  Members              : {stats['members']}")
+    print(f"  Reused (hash match)  : {stats['reused']}")
+    print(f"  (Re)compressed       : {stats['compressed']}")
+    print(f"  Stored raw           : {stats['raw']}")
+    print(f"  Dropped since last   : {stats['removed']}")
+    print(f"  Loose bytes          : {stats['bytes_in']:,}")
+    print(f"  Pack bytes           : {stats['bytes_out']:,} "
+          f"({stats['bytes_out'] / max(stats['bytes_in'], 1):.0%})")
+    print(f"  Build time           : {elapsed:.1f} s")
+    print()
+    print(f"Output written to: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+score_sinclair.py — LiftTilYaDie Sinclair Scoring
+
+Scores every archived result (lifts.csv from extract_lifts.py) with the
+Sinclair coefficient for the lifter's sex and bodyweight, using the
+coefficient table of the Olympic cycle the meet falls in. All rows are
+scored in one vectorised numpy pass.
+
+Bodyweight handling:
+  - BWT column present              -> scored on that bodyweight
+  - missing/unparseable, class known -> scored on the class limit
+                                       (bwt_source = class_limit)
+  - missing and open-ended (+) class -> left unscored
+
+Press-era (pre-1973) totals include the press, so those rows are scored on
+snatch + clean & jerk instead.
+
+Output: scripts/output/sinclair.csv  (sorted by score, best first)
+
+Usage (from repo root):
+    python scripts/score_sinclair.py
+    python scripts/score_sinclair.py --top 25 --sex F --era 1998-2018
+"""
+
+import argparse
+import csv
+import sys
+import time
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    print("ERROR: numpy not installed. Run: pip install numpy")
+    sys.exit(1)
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from compute_records import ERAS, build_columns  # noqa: E402
+from extract_lifts import LIFTS_CSV, fmt, load_lifts  # noqa: E402
+from index_results import OUTPUT_DIR  # noqa: E402
+
+# ---------------------------------------------------------------------------
+# Paths
+# ---------------------------------------------------------------------------
+
+SINCLAIR_CSV = OUTPUT_DIR / "sinclair.csv"
+
+SINCLAIR_FIELDS = [
+    "rank", "name", "sex", "era", "weight_class", "bwt", "bwt_source",
+    "scored_total", "coefficient", "sinclair_table", "sinclair", "meet_year", "file_path",
+]
+
+# ---------------------------------------------------------------------------
+# Coefficient tables — (first year, men A, men b, women A, women b)
+#
+# coefficient = 10 ** (A * log10(bwt / b) ** 2)  for bwt < b, else 1
+#
+# 2009 onward are the IWF tables. The earlier rows were recovered from the
+# Sinclair scores printed on archive pages (score / total at the listed
+# bodyweight, fitted on the junior and open rows; masters rows carry an age
+# factor): 1985 from the 87-88 Golden West, SF Open and PWA pages, 1989
+# from 89PWAChp, 1993 from 93SrNats + 96SrNats, 1997 from 97/98PWAChp +
+# 98CALSt, 2001 from the 03/04 Golden West juniors, 2005 from 05PWAChp.
+# Women's None = no women's table recovered for that cycle (pre-1993 pages
+# scored women on the men's table); those rows use the next women's table.
+# Meets before the first table are scored on it; rows with no meet year
+# on UNDATED_TABLE.
+# ---------------------------------------------------------------------------
+
+SINCLAIR_TABLES = [
+    (1985, 1.295438,    144.861, None,        None),
+    (1989, 1.293085,    144.976, None,        None),
+    (1993, 1.450392,    131.975, 1.078103,    116.298),
+    (1997, 1.431162,    132.621, None,        None),
+    (2001, 0.938540,    157.144, None,        None),
+    (2005, 0.976325,    139.829, None,        None),
+    (2009, 0.784780654, 173.961, 1.056683941, 125.441),
+    (2013, 0.794358141, 174.393, 0.897260740, 148.026),
+    (2017, 0.751945030, 175.508, 0.783497476, 153.655),
+    (2021, 0.722762521, 193.609, 0.787004341, 153.757),
+]
+UNDATED_TABLE = 2009
+
+
+def sex_tables() -> tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+    """
+    Table start years plus per-row [A, b, table year] for men and women,
+    with women's gaps filled from the next row that has a women's table.
+    """
+    starts = np.array([t[0] for t in SINCLAIR_TABLES], dtype=np.float64)
+    men = np.array([(t[1], t[2], t[0]) for t in SINCLAIR_TABLES], dtype=np.float64)
+    women = np.empty_like(men)
+    fill = None
+    for k in range(len(SINCLAIR_TABLES) - 1, -1, -1):
+        year, _, _, a, b = SINCLAIR_TABLES[k]
+        if a is not None:
+            fill = (a, b, year)
+        women[k] = fill
+    return starts, men, women
+
+
+def coefficient_arrays(years: "np.ndarray", female: "np.ndarray") -> tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Per-row (A, b, table year) picked from the table in force in each meet year."""
+    starts, men, women = sex_tables()
+    which = np.searchsorted(starts, np.nan_to_num(years, nan=UNDATED_TABLE), side="right") - 1
+    which = np.clip(which, 0, len(SINCLAIR_TABLES) - 1)
+    picked = np.where(female[:, None], women[which], men[which])
+    return picked[:, 0], picked[:, 1], picked[:, 2]
+
+
+def class_limits(weight_classes: "np.ndarray") -> "np.ndarray":
+    """Upper bodyweight limit of each class; NaN for '+' and unknown classes."""
+    limits = np.full(len(weight_classes), np.nan)
+    for i, wc in enumerate(weight_classes):
+        if not wc or wc.startswith("+"):
+            continue
+        try:
+            limits[i] = float(wc[:-2]) * 0.45359237 if wc.endswith("lb") else float(wc)
+        except ValueError:
+            pass
+    return limits
+
+
+# ---------------------------------------------------------------------------
+# Step 1 — Vectorised scoring
+# ---------------------------------------------------------------------------
+
+def score(cols: dict[str, "np.ndarray"]) -> dict[str, "np.ndarray"]:
+    """Add bwt_used, bwt_source, scored_total, coefficient, sinclair_table and sinclair columns."""
+    bwt = cols["bwt"]
+    limits = class_limits(cols["weight_class"])
+    bwt_used = np.where(np.isnan(bwt), limits, bwt)
+    bwt_source = np.where(
+        ~np.isnan(bwt), "bwt", np.where(~np.isnan(limits), "class_limit", "")
+    ).astype(object)
+
+    two_lift = np.nan_to_num(cols["snatch"]) + np.nan_to_num(cols["cj"])
+    two_lift = np.where((cols["snatch"] > 0) & (cols["cj"] > 0), two_lift, np.nan)
+    scored_total = np.where(cols["era"] == "pre-1973", two_lift, cols["total"])
+    scored_total = np.where(scored_total > 0, scored_total, np.nan)
+
+    a, b, table_year = coefficient_arrays(cols["meet_year"], cols["sex"] == "F")
+    with np.errstate(invalid="ignore", divide="ignore"):
+        coeff = np.where(bwt_used < b, 10.0 ** (a * np.log10(bwt_used / b) ** 2), 1.0)
+    coeff = np.where(np.isnan(bwt_used), np.nan, coeff)
+
+    cols["bwt_used"] = bwt_used
+    cols["bwt_source"] = bwt_source
+    cols["scored_total"] = scored_total
+    cols["coefficient"] = coeff
+    cols["sinclair_table"] = table_year
+    cols["sinclair"] = scored_total * coeff
+    return cols
+
+
+def dedupe_mask(cols: dict[str, "np.ndarray"]) -> "np.ndarray":
+    """
+    Root and Results pools hold copies of some meets; keep the first row of
+    each (meet file name, lifter, class) so rankings list it once. The total
+    is left out of the key (a copy may have been corrected, and NaN never
+    equals NaN); unscored rows are never ranked, so they don't claim a key.
+    """
+    seen = set()
+    keep = np.zeros(len(cols["name"]), dtype=bool)
+    for i, (path, name, wc, sinclair) in enumerate(zip(
+            cols["file_path"], cols["name"], cols["weight_class"], cols["sinclair"])):
+        if np.isnan(sinclair):
+            continue
+        key = (path.rsplit("/", 1)[-1].lower(), name.lower(), wc)
+        if key not in seen:
+            seen.add(key)
+            keep[i] = True
+    return keep
+
+
+# ---------------------------------------------------------------------------
+# Step 2 — Precomputed top-N index
+# ---------------------------------------------------------------------------
+
+ALL = ""
+
+
+def build_rank_index(cols: dict[str, "np.ndarray"]) -> dict[tuple[str, str], "np.ndarray"]:
+    """
+    Row indices sorted by Sinclair (best first) for every (sex, era) filter,
+    with ALL as a wildcard. Built once; top-N queries are then a slice.
+    """
+    scores = cols["sinclair"]
+    ranked = np.flatnonzero(~np.isnan(scores) & dedupe_mask(cols))
+    ranked = ranked[np.argsort(-scores[ranked], kind="stable")]
+
+    sexes = cols["sex"][ranked]
+    eras = cols["era"][ranked]
+    index = {(ALL, ALL): ranked}
+    for sex in ("M", "F"):
+        index[(sex, ALL)] = ranked[sexes == sex]
+    for _, era in ERAS:
+        in_era = eras == era
+        index[(ALL, era)] = ranked[in_era]
+        for sex in ("M", "F"):
+            index[(sex, era)] = ranked[in_era & (sexes == sex)]
+    return index
+
+
+def top_n(index: dict[tuple[str, str], "np.ndarray"], n: int,
+          sex: str = ALL, era: str = ALL) -> "np.ndarray":
+    return index.get((sex, era), np.empty(0, dtype=np.int64))[:n]
+
+
+def ranking_row(cols: dict[str, "np.ndarray"], rank: int, i: int) -> dict:
+    return {
+        "rank": rank,
+        "name": cols["name"][i],
+        "sex": cols["sex"][i],
+        "era": cols["era"][i],
+        "weight_class": cols["weight_class"][i],
+        "bwt": fmt(float(cols["bwt_used"][i])),
+        "bwt_source": cols["bwt_source"][i],
+        "scored_total": fmt(float(cols["scored_total"][i])),
+        "coefficient": f"{cols['coefficient'][i]:.5f}",
+        "sinclair_table": str(int(cols["sinclair_table"][i])),
+        "sinclair": f"{cols['sinclair'][i]:.2f}",
+        "meet_year": str(int(cols["meet_year"][i])) if cols["meet_year"][i] == cols["meet_year"][i] else "",
+        "file_path": cols["file_path"][i],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Sinclair-score every archived result.")
+    parser.add_argument("--top", type=int, default=20, help="rows to print (default 20)")
+    parser.add_argument("--sex", choices=("M", "F"), default=ALL)
+    parser.add_argument("--era", choices=[e for _, e in ERAS], default=ALL)
+    args = parser.parse_args()
+
+    if not LIFTS_CSV.exists():
+        print(f"ERROR: {LIFTS_CSV} not found. Run: python scripts/extract_lifts.py")
+        sys.exit(1)
+
+    print(f"Loading {LIFTS_CSV.name}...")
+    rows = load_lifts()
+    cols = build_columns(rows)
+    print(f"  -> {len(rows)} lift rows")
+
+    start = time.perf_counter()
+    score(cols)
+    index = build_rank_index(cols)
+    elapsed = time.perf_counter() - start
+
+    ranked = index[(ALL, ALL)]
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    with open(SINCLAIR_CSV, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=SINCLAIR_FIELDS)
+        writer.writeheader()
+        writer.writerows(ranking_row(cols, rank, i) for rank, i in enumerate(ranked, 1))
+
+    sources = cols["bwt_source"][~np.isnan(cols["scored_total"])]
+    print()
+    print("=" * 50)
+    print("SUMMARY")
+    print(f"  Rows with a total    : {len(sources)}")
+    print(f"  Scored on BWT        : {int(np.sum(sources == 'bwt'))}")
+    print(f"  Scored on class limit: {int(np.sum(sources == 'class_limit'))}")
+    print(f"  Unscored (no BWT)    : {int(np.sum(sources == ''))}")
+    print(f"  Ranked (deduplicated): {len(ranked)}")
+    print(f"  Scoring + index      : {elapsed * 1000:.1f} ms")
+    print()
+
+    label = " / ".join(x for x in (args.sex, args.era) if x) or "all results"
+    print(f"TOP {args.top} SINCLAIR ({label}):")
+    for rank, i in enumerate(top_n(index, args.top, args.sex, args.era), 1):
+        r = ranking_row(cols, rank, i)
+        print(f"  {rank:3d}. {r['sinclair']:>7s}  {r['name'][:28]:28s} {r['sex']} "
+              f"{r['bwt']:>6s} {r['scored_total']:>6s}  {r['meet_year']}")
+
+    print()
+    print(f"Output written to: {SINCLAIR_CSV}")
+
+
+if __name__ == "__main__":
+    main()
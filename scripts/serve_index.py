@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+serve_index.py — local HTTP query service over the archive indexes
+
+Serves results_index.json and assets_index.csv (from index_results.py /
+index_assets.py) as a small JSON API so developers and the Next.js dev
+server don't have to re-read the files per query. Standard library only.
+
+Endpoints:
+  GET /health
+  GET /meets?year=2001&location=sacramento&source=jim+schmitz&orphan=true&pool=root
+  GET /assets?category=image&subdir=Results&referenced=false
+  GET /assets/<rel_path>          e.g. /assets/Results/96Marin.htm
+      -> the asset row plus the results_index meets with that filename
+
+List endpoints take limit (default 100, max 1000) and offset. Filters are
+ANDed; location matches whole words anywhere in the location text.
+
+Performance:
+  - per-filter indexes (year, location word, source, orphan, pool, asset
+    category/subdir/referenced) are built once per load; a query intersects
+    the matching posting lists instead of scanning every record
+  - rendered responses are kept in an LRU cache per loaded snapshot
+  - strong ETags (sha256 of the body) with If-None-Match -> 304
+  - gzip when the client accepts it
+  - the index files are polled; when either changes the service swaps in
+    a freshly built snapshot (and with it a fresh cache) without a restart
+
+Usage (from repo root):
+    python scripts/serve_index.py                 # http://127.0.0.1:8765
+    python scripts/serve_index.py --port 9000 --poll 2
+    python scripts/loadtest_index.py              # p50/p99 against it
+"""
+
+import argparse
+import csv
+import gzip
+import hashlib
+import json
+import re
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+# ---------------------------------------------------------------------------
+# Paths / settings
+# ---------------------------------------------------------------------------
+
+OUTPUT_DIR   = Path(__file__).parent / "output"
+RESULTS_JSON = OUTPUT_DIR / "results_index.json"
+ASSETS_CSV   = OUTPUT_DIR / "assets_index.csv"
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+RESPONSE_CACHE_SIZE = 2048
+GZIP_MIN_BYTES = 1024
+
+MEETS_PARAMS = {"year", "location", "source", "orphan", "pool", "limit", "offset"}
+ASSETS_PARAMS = {"category", "subdir", "referenced", "limit", "offset"}
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+class QueryError(ValueError):
+    """Bad query parameters -> 400."""
+
+
+def words(text: str) -> list[str]:
+    return WORD_RE.findall(text.lower())
+
+
+def parse_bool(name: str, value: str) -> bool:
+    v = value.lower()
+    if v in ("true", "1", "yes"):
+        return True
+    if v in ("false", "0", "no"):
+        return False
+    raise QueryError(f"{name} must be true or false, got {value!r}")
+
+
+def parse_int(name: str, value: str, lo: int, hi: int) -> int:
+    try:
+        n = int(value)
+    except ValueError:
+        raise QueryError(f"{name} must be an integer, got {value!r}") from None
+    if not lo <= n <= hi:
+        raise QueryError(f"{name} must be between {lo} and {hi}")
+    return n
+
+
+# ---------------------------------------------------------------------------
+# Step 1 — Snapshot: loaded records + per-filter indexes
+# ---------------------------------------------------------------------------
+
+def file_signature(paths: tuple[Path, ...]) -> tuple:
+    """Changes whenever any index file is rewritten."""
+    sig = []
+    for p in paths:
+        try:
+            st = p.stat()
+            sig.append((st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            sig.append(None)
+    return tuple(sig)
+
+
+def posting(index: dict[str, list[int]], key: str, i: int):
+    index.setdefault(key, []).append(i)
+
+
+def intersect(lists: list[list[int]]) -> list[int]:
+    """Sorted intersection of sorted posting lists, smallest first."""
+    if not lists:
+        return []
+    lists = sorted(lists, key=len)
+    result = lists[0]
+    for other in lists[1:]:
+        members = set(other)
+        result = [i for i in result if i in members]
+        if not result:
+            break
+    return result
+
+
+class Snapshot:
+    """One load of the index files, with indexes and a response cache."""
+
+    def __init__(self, results_path: Path, assets_path: Path):
+        self.paths = (results_path, assets_path)
+        self.signature = file_signature(self.paths)
+        self.loaded_at = time.strftime("%Y-%m-%dT%H:%M:%S")
+
+        with open(results_path, encoding="utf-8") as f:
+            self.meets: list[dict] = json.load(f)
+        if not isinstance(self.meets, list):
+            raise TypeError(f"{results_path.name}: expected a list of meets")
+        self.assets: list[dict] = []
+        if assets_path.exists():
+            with open(assets_path, newline="", encoding="utf-8") as f:
+                self.assets = list(csv.DictReader(f))
+
+        # Meets: year / location word / source / orphan / pool -> row indices
+        self.by_year: dict[str, list[int]] = {}
+        self.by_word: dict[str, list[int]] = {}
+        self.by_source: dict[str, list[int]] = {}
+        self.by_orphan: dict[str, list[int]] = {}
+        self.by_pool: dict[str, list[int]] = {}
+        self.meets_by_filename: dict[str, list[int]] = {}
+        for i, m in enumerate(self.meets):
+            posting(self.by_year, m["date_start"][:4], i)
+            for w in dict.fromkeys(words(m["location"])):
+                posting(self.by_word, w, i)
+            posting(self.by_source, " ".join(words(m["source"])), i)
+            posting(self.by_orphan, str(not m["linked_from_root"]).lower(), i)
+            posting(self.by_pool, m["pool"].lower(), i)
+            posting(self.meets_by_filename, m["filename"].lower(), i)
+
+        # Assets: category / subdir / referenced, plus rel_path lookup
+        self.by_category: dict[str, list[int]] = {}
+        self.by_subdir: dict[str, list[int]] = {}
+        self.by_referenced: dict[str, list[int]] = {}
+        self.asset_by_path: dict[str, int] = {}
+        for i, a in enumerate(self.assets):
+            posting(self.by_category, a["category"].lower(), i)
+            posting(self.by_subdir, a["subdir"].lower(), i)
+            posting(self.by_referenced, a["referenced_from_w8lift"].lower(), i)
+            self.asset_by_path[a["rel_path"].lower()] = i
+
+        self.render = lru_cache(maxsize=RESPONSE_CACHE_SIZE)(self._render)
+
+    # -- queries ------------------------------------------------------------
+
+    def query_meets(self, q: dict[str, str]) -> dict:
+        lists = []
+        if "year" in q:
+            lists.append(self.by_year.get(q["year"], []))
+        if "location" in q:
+            terms = words(q["location"])
+            if not terms:
+                raise QueryError("location has no searchable words")
+            lists.extend(self.by_word.get(w, []) for w in terms)
+        if "source" in q:
+            lists.append(self.by_source.get(" ".join(words(q["source"])), []))
+        if "orphan" in q:
+            lists.append(self.by_orphan.get(str(parse_bool("orphan", q["orphan"])).lower(), []))
+        if "pool" in q:
+            lists.append(self.by_pool.get(q["pool"].lower(), []))
+        hits = intersect(lists) if lists else range(len(self.meets))
+        return self.page(hits, self.meets, q)
+
+    def query_assets(self, q: dict[str, str]) -> dict:
+        lists = []
+        if "category" in q:
+            lists.append(self.by_category.get(q["category"].lower(), []))
+        if "subdir" in q:
+            lists.append(self.by_subdir.get(q["subdir"].lower(), []))
+        if "referenced" in q:
+            ref = parse_bool("referenced", q["referenced"])
+            lists.append(self.by_referenced.get(str(ref).lower(), []))
+        hits = intersect(lists) if lists else range(len(self.assets))
+        return self.page(hits, self.assets, q)
+
+    def asset_references(self, rel_path: str) -> dict | None:
+        i = self.asset_by_path.get(rel_path.lower())
+        if i is None:
+            return None
+        asset = self.assets[i]
+        meets = [self.meets[j] for j in self.meets_by_filename.get(asset["filename"].lower(), [])]
+        return {
+            "asset": asset,
+            "referenced_from_w8lift": asset["referenced_from_w8lift"] == "True",
+            "reference_types": [t for t in asset["reference_type"].split("; ") if t],
+            "meets": meets,
+        }
+
+    @staticmethod
+    def page(hits, records: list[dict], q: dict[str, str]) -> dict:
+        limit = parse_int("limit", q.get("limit", str(DEFAULT_LIMIT)), 1, MAX_LIMIT)
+        offset = parse_int("offset", q.get("offset", "0"), 0, 10**9)
+        return {
+            "total": len(hits),
+            "offset": offset,
+            "limit": limit,
+            "results": [records[i] for i in hits[offset:offset + limit]],
+        }
+
+    # -- rendering ----------------------------------------------------------
+
+    def _render(self, path: str, query: tuple[tuple[str, str], ...]) -> tuple[int, bytes, bytes | None, str]:
+        """(status, body, gzipped body or None, etag) for one normalised request."""
+        q = dict(query)
+        try:
+            status, payload = self.route(path, q)
+        except QueryError as e:
+            status, payload = 400, {"error": str(e)}
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        gz = gzip.compress(body, 6) if len(body) >= GZIP_MIN_BYTES else None
+        etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        return status, body, gz, etag
+
+    def route(self, path: str, q: dict[str, str]) -> tuple[int, dict]:
+        if path == "/health":
+            return 200, {
+                "meets": len(self.meets),
+                "assets": len(self.assets),
+                "loaded_at": self.loaded_at,
+                "files": [str(p) for p in self.paths],
+            }
+        if path == "/meets":
+            check_params(q, MEETS_PARAMS)
+            return 200, self.query_meets(q)
+        if path == "/assets":
+            check_params(q, ASSETS_PARAMS)
+            return 200, self.query_assets(q)
+        if path.startswith("/assets/"):
+            found = self.asset_references(path[len("/assets/"):])
+            if found is None:
+                return 404, {"error": f"no asset {path[len('/assets/'):]!r}"}
+            return 200, found
+        return 404, {"error": f"unknown endpoint {path}"}
+
+
+def check_params(q: dict[str, str], allowed: set[str]):
+    unknown = sorted(set(q) - allowed)
+    if unknown:
+        raise QueryError(f"unknown parameter(s): {', '.join(unknown)} "
+                         f"(allowed: {', '.join(sorted(allowed))})")
+
+
+# ---------------------------------------------------------------------------
+# Step 2 — Hot reload
+# ---------------------------------------------------------------------------
+
+class SnapshotHolder:
+    """The current Snapshot, swapped whole when the index files change."""
+
+    def __init__(self, results_path: Path, assets_path: Path):
+        self.paths = (results_path, assets_path)
+        self.current = Snapshot(results_path, assets_path)
+        self.reloads = 0
+        self.failed_signature: tuple | None = None
+
+    def poll_forever(self, interval: float):
+        while True:
+            time.sleep(interval)
+            signature = file_signature(self.paths)
+            if signature in (self.current.signature, self.failed_signature):
+                continue
+            try:
+                snapshot = Snapshot(*self.paths)
+            except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+                # An indexer mid-write or a file of the wrong shape; keep
+                # serving the current snapshot until the files change again
+                print(f"  reload skipped: {type(e).__name__}: {e}")
+                self.failed_signature = signature
+                continue
+            self.current = snapshot
+            self.reloads += 1
+            print(f"  reloaded: {len(snapshot.meets)} meets, {len(snapshot.assets)} assets")
+
+
+# ---------------------------------------------------------------------------
+# Step 3 — HTTP handler
+# ---------------------------------------------------------------------------
+
+class IndexHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive
+    # Headers and body go out in separate writes; with Nagle on, each
+    # keep-alive response stalls ~40 ms waiting on the client's delayed ACK
+    disable_nagle_algorithm = True
+    holder: SnapshotHolder          # set in main()
+    quiet = False
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        path = unquote(url.path).rstrip("/") or "/"
+        query = tuple(sorted(parse_qsl(url.query)))
+        status, body, gz, etag = self.holder.current.render(path, query)
+
+        use_gzip = gz is not None and "gzip" in self.headers.get("Accept-Encoding", "")
+        if use_gzip:
+            # A different representation needs a different strong ETag
+            etag = etag[:-1] + '-gz"'
+
+        if status == 200 and etag in self.headers.get("If-None-Match", ""):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        payload = gz if use_gzip else body
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the archive indexes over local HTTP.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--poll", type=float, default=1.0, help="seconds between index file checks")
+    parser.add_argument("--quiet", action="store_true", help="don't log each request")
+    args = parser.parse_args()
+
+    if not RESULTS_JSON.exists():
+        print(f"ERROR: {RESULTS_JSON} not found. Run: python scripts/index_results.py")
+        raise SystemExit(1)
+
+    start = time.perf_counter()
+    holder = SnapshotHolder(RESULTS_JSON, ASSETS_CSV)
+    snapshot = holder.current
+    print(f"Loaded {len(snapshot.meets)} meets, {len(snapshot.assets)} assets "
+          f"in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    threading.Thread(target=holder.poll_forever, args=(args.poll,), daemon=True).start()
+
+    IndexHandler.holder = holder
+    IndexHandler.quiet = args.quiet
+    server = ThreadingHTTPServer((args.host, args.port), IndexHandler)
+    print(f"Serving on http://{args.host}:{args.port}  (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+sharding.py — deterministic shard assignment for the archive indexers
+
+A file belongs to shard i of N (1-based) when a stable hash of its
+lowercased archive-relative path falls in bucket i. The hash is SHA-1
+rather than hash() so every machine and Python version agrees, and the
+path is lowercased so index_results.py ('results/96marin.htm') and
+index_assets.py ('Results/96Marin.htm') put the same file in the same shard.
+
+Shard outputs are written to scripts/output/shards/ and combined with
+merge_shards.py.
+"""
+
+import argparse
+import hashlib
+import json
+from pathlib import Path
+
+SHARDS_DIR = Path(__file__).parent / "output" / "shards"
+
+
+def parse_shard(spec: str) -> tuple[int, int]:
+    """Parse '--shard i/N' into (i, N); i is 1-based."""
+    try:
+        i_str, n_str = spec.split("/")
+        i, n = int(i_str), int(n_str)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected i/N, got {spec!r}")
+    if n < 1 or not 1 <= i <= n:
+        raise argparse.ArgumentTypeError(f"shard {spec!r} out of range (need 1 <= i <= N)")
+    return i, n
+
+
+def shard_of(rel_path: str, num_shards: int) -> int:
+    """1-based shard number for an archive-relative path."""
+    digest = hashlib.sha1(rel_path.lower().encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % num_shards + 1
+
+
+def in_shard(rel_path: str, shard: tuple[int, int] | None) -> bool:
+    if shard is None:
+        return True
+    i, n = shard
+    return shard_of(rel_path, n) == i
+
+
+def shard_path(kind: str, shard: tuple[int, int]) -> Path:
+    i, n = shard
+    return SHARDS_DIR / f"{kind}.shard-{i}-of-{n}.json"
+
+
+def write_shard(kind: str, shard: tuple[int, int], records: list[dict]) -> Path:
+    """Write one shard's records with enough header to validate the merge."""
+    path = shard_path(kind, shard)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "kind": kind,
+            "shard": shard[0],
+            "num_shards": shard[1],
+            "records": records,
+        }, f, indent=2)
+    return path
+
+
+def load_shards(kind: str) -> list[dict]:
+    """
+    Load every shard file of one kind. Raises ValueError unless exactly one
+    complete set (1..N of a single N) is present.
+    """
+    shards = []
+    for path in sorted(SHARDS_DIR.glob(f"{kind}.shard-*-of-*.json")):
+        with open(path, encoding="utf-8") as f:
+            shards.append(json.load(f))
+    if not shards:
+        raise ValueError(f"no {kind} shards found in {SHARDS_DIR}")
+
+    counts = {s["num_shards"] for s in shards}
+    if len(counts) != 1:
+        raise ValueError(f"{kind} shards from different N present: {sorted(counts)}")
+    n = counts.pop()
+    have = sorted(s["shard"] for s in shards)
+    if have != list(range(1, n + 1)):
+        missing = sorted(set(range(1, n + 1)) - set(have))
+        raise ValueError(f"{kind} shards incomplete: missing {missing} of {n}")
+    return shards
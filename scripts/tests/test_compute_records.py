@@ -0,0 +1,60 @@
+"""
+Records and champions diffs on real archive pages.
+
+Run (from repo root):
+    python -m pytest -q scripts/tests
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from compute_records import (  # noqa: E402
+    build_columns,
+    compute_records,
+    diff_champs_page,
+    normalize_person,
+    rejected_rows,
+)
+from extract_lifts import extract_file, sex_only_class  # noqa: E402
+from index_results import ARCHIVE_ROOT, RESULTS_DIR  # noqa: E402
+
+
+def sr_nats_rows() -> list[dict]:
+    pages = sorted(ARCHIVE_ROOT.glob("*SrNats.htm")) + sorted(RESULTS_DIR.glob("*SrNats.htm"))
+    return [row for page in pages for row in extract_file(page)]
+
+
+def test_womens_class_never_in_mens_champions():
+    rows = sr_nats_rows()
+    diff = diff_champs_page(build_columns(rows), {})
+    champions = {normalize_person(d["name"]) for d in diff}
+
+    women_winners = {
+        normalize_person(r["name"]) for r in rows
+        if r["place"] == "1" and sex_only_class(r["meet_year"], r["weight_class"]) == "F"
+    }
+    assert women_winners
+    assert not women_winners & champions
+    assert "cheryl haworth" not in champions
+    assert "dancia rue" not in champions
+
+
+def test_rows_in_the_other_sexs_class_are_rejected():
+    rows = [
+        {"file_path": "a.htm", "name": "A", "sex": "M", "weight_class": "+75", "meet_year": "2001",
+         "yob": "", "bwt": "120", "place": "1", "snatch": "150", "cj": "190", "total": "340"},
+        {"file_path": "a.htm", "name": "B", "sex": "F", "weight_class": "+75", "meet_year": "2001",
+         "yob": "", "bwt": "110", "place": "1", "snatch": "120", "cj": "150", "total": "270"},
+    ]
+    cols = build_columns(rows)
+    assert rejected_rows(cols) == [0]
+    assert {r["sex"] for r in compute_records(cols)} == {"F"}
+
+
+def test_normalize_person_drops_middle_initials():
+    assert normalize_person("Chad T. Vaughn") == normalize_person("Chad Vaughn") == "chad vaughn"
+    assert normalize_person("Clyde B. Emrich") == normalize_person("EMRICH, CLYDE")
+    assert normalize_person("Charles T. Vinci Jr.") == normalize_person("Charles Vinci")
+    assert normalize_person("O'Brien, Pat") == "pat obrien"
@@ -0,0 +1,56 @@
+"""
+Sex of lift rows on real archive pages.
+
+Run (from repo root):
+    python -m pytest -q scripts/tests
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from extract_lifts import class_valid, extract_file, parse_sex_row  # noqa: E402
+from index_results import RESULTS_DIR  # noqa: E402
+
+
+def by_name(rows: list[dict]) -> dict[str, dict]:
+    return {r["name"]: r for r in rows}
+
+
+def test_two_session_page_splits_women_and_men():
+    # Bare '48 Kg' .. '75+ Kg' then '56 Kg' .. '105+ Kg'; no sex words
+    rows = extract_file(RESULTS_DIR / "01SrNats.htm")
+    lifters = by_name(rows)
+    assert lifters["Haworth, Cheryl"]["sex"] == "F"
+    assert lifters["Rue, Dancia"]["sex"] == "F"
+    assert lifters["Rue, Matthew"]["sex"] == "M"
+    # 69 Kg is contested by both; the session decides
+    sexes_69 = {r["sex"] for r in rows if r["weight_class"] == "69"}
+    assert sexes_69 == {"F", "M"}
+    assert all(class_valid(r["meet_year"], r["sex"], r["weight_class"]) for r in rows)
+
+
+def test_single_mislabelled_class_row_keeps_session_sex():
+    # '64 Kg WOMEN' between '59 Kg MEN' and '70 Kg MEN'
+    lifters = by_name(extract_file(RESULTS_DIR / "94AmOpen.htm"))
+    assert lifters["James Carter"]["sex"] == "M"
+    assert lifters["Thanh Nguyen"]["sex"] == "M"
+
+
+def test_sex_row_with_leading_sex_word():
+    def row(text):
+        return [(text, 6, False)]
+
+    assert parse_sex_row(row("MEN 16 & 17")) == "M"
+    assert parse_sex_row(row("MEN 15 & UNDER")) == "M"
+    assert parse_sex_row(row("WOMEN 16 & 17")) == "F"
+    assert parse_sex_row(row("13 & UNDER GIRLS")) == "F"
+    assert parse_sex_row(row("WOMEN")) == "F"
+
+
+def test_summary_table_class_overrides_heading():
+    # Best-lifter table listed under 'Team Placings - Men'
+    rows = extract_file(RESULTS_DIR / "12SrNats.htm")
+    robles = [r for r in rows if r["name"] == "Sarah E. Robles"]
+    assert robles and all(r["sex"] == "F" for r in robles)